@@ -5,13 +5,15 @@ handling date conversions, and setting up logging. It leverages external librari
 csv and json for file operations, and datetime for date manipulations.
 """
 import csv
+import hashlib
 import json
 import boto3
 import yaml
 from io import StringIO
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import logging
 from io import IOBase
+from typing import Any, Callable
 
 
 RODAAPP_BUCKET_PREFIX = "s3://rodaapp-rappidriverchain"
@@ -39,6 +41,24 @@ def setup_local_logger() -> None:
     logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
 
+def get_derived_from_secret(cache: dict, secret: str, derive: Callable[[str], Any]) -> Any:
+    """
+    Return the object derived from a secret, such as the account of a mnemonic, deriving it only the first time.
+
+    The cache is keyed by the SHA-256 digest of the secret, so module-level caches kept across warm AWS Lambda
+    invocations do not hold the secret itself.
+
+    :param cache: The dictionary where the derived objects are kept.
+    :param secret: The secret the object is derived from.
+    :param derive: The function deriving the object from the secret.
+    :return: The object derived from the secret.
+    """
+    key = hashlib.sha256(secret.encode()).digest()
+    if key not in cache:
+        cache[key] = derive(secret)
+    return cache[key]
+
+
 def split_s3(s3_path: str) -> tuple:
     """
     Split an S3 path into its bucket name and key components.
@@ -274,3 +294,24 @@ def to_unix_timestamp(str_date: str, format: str):
     timestamp = int(datetime_obj.timestamp())
     
     return timestamp
+
+
+def iso_to_unix_timestamp(str_date: str) -> int:
+    """
+    Convert an ISO 8601 date string (e.g., '2024-03-01T05:00:00.000Z') to a Unix timestamp.
+
+    It relies on `datetime.fromisoformat`, which is implemented in C and much faster than the `strptime`
+    parsing done by `to_unix_timestamp`. Dates without timezone information, as well as the ones ending
+    with 'Z', are interpreted as UTC.
+
+    Parameters:
+    - str_date (str): The ISO 8601 date string to be converted.
+
+    Returns:
+    - int: The Unix timestamp equivalent of the given date string.
+    """
+    datetime_obj = datetime.fromisoformat(str_date[:-1] if str_date.endswith('Z') else str_date)
+    if datetime_obj.tzinfo is None:
+        datetime_obj = datetime_obj.replace(tzinfo=timezone.utc)
+
+    return int(datetime_obj.timestamp())
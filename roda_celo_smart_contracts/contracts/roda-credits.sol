@@ -36,6 +36,24 @@ contract RodaCreditCOP is ERC721, AccessControl {
     // Mapping to ensure the uniqueness of payment IDs
     mapping(uint => uint) public paymentToCredit;
 
+    // Credit issuance parameters, used for issuing several credits in a single transaction
+    struct CreditIssuance {
+        address to;
+        uint creditId;
+        uint principal;
+        uint totalRepaymentAmount;
+        uint issuanceDate;
+        uint creditTerm;
+    }
+
+    // Payment parameters, used for recording several payments in a single transaction
+    struct PaymentRecord {
+        uint creditId;
+        uint paymentId;
+        uint paymentAmount;
+        uint paymentDate;
+    }
+
     constructor() ERC721("RodaCreditCOP", "RCCOP") {
         _grantRole(DEFAULT_ADMIN_ROLE, msg.sender);
         _grantRole(MINTER_ROLE, msg.sender);
@@ -58,6 +76,22 @@ contract RodaCreditCOP is ERC721, AccessControl {
     );
 
     function issueCredit(address to, uint creditId, uint _principal, uint totalRepaymentAmount, uint _issuanceDate, uint _creditTerm) public onlyRole(MINTER_ROLE) {
+        _issueCredit(to, creditId, _principal, totalRepaymentAmount, _issuanceDate, _creditTerm);
+    }
+
+    // Function to issue several credits in a single transaction, sharing the base transaction cost among them.
+    // Credits already minted are skipped, so a batch partially published by a previous run can be sent again.
+    function issueCreditBatch(CreditIssuance[] calldata credits) external onlyRole(MINTER_ROLE) {
+        for (uint i = 0; i < credits.length; ++i) {
+            CreditIssuance calldata credit = credits[i];
+            if (_exists(credit.creditId)) {
+                continue;
+            }
+            _issueCredit(credit.to, credit.creditId, credit.principal, credit.totalRepaymentAmount, credit.issuanceDate, credit.creditTerm);
+        }
+    }
+
+    function _issueCredit(address to, uint creditId, uint _principal, uint totalRepaymentAmount, uint _issuanceDate, uint _creditTerm) internal {
         principal[creditId] = _principal;
         outstandingBalance[creditId] = totalRepaymentAmount; // Setting the outstandingBalance at mint time.
         issuanceDate[creditId] = _issuanceDate; // Setting the issuanceDate from the parameter.
@@ -71,6 +105,23 @@ contract RodaCreditCOP is ERC721, AccessControl {
     // Function to update the outstandingBalance and record the payment with paymentDate
     function recordPayment(uint creditId, uint paymentId, uint paymentAmount, uint paymentDate) public onlyRole(DEFAULT_ADMIN_ROLE) {
         require(paymentToCredit[paymentId] == 0); // (make sure IDs in the original database can't be zero)
+        _recordPayment(creditId, paymentId, paymentAmount, paymentDate);
+    }
+
+    // Function to record several payments in a single transaction, sharing the base transaction cost among them.
+    // Payments already recorded are skipped, so a batch partially published by a previous run can be sent again.
+    // A payment above the outstanding balance of its credit still reverts the whole batch.
+    function recordPaymentBatch(PaymentRecord[] calldata payments) external onlyRole(DEFAULT_ADMIN_ROLE) {
+        for (uint i = 0; i < payments.length; ++i) {
+            PaymentRecord calldata payment = payments[i];
+            if (paymentToCredit[payment.paymentId] != 0) {
+                continue;
+            }
+            _recordPayment(payment.creditId, payment.paymentId, payment.paymentAmount, payment.paymentDate);
+        }
+    }
+
+    function _recordPayment(uint creditId, uint paymentId, uint paymentAmount, uint paymentDate) internal {
         outstandingBalance[creditId] = outstandingBalance[creditId].sub(paymentAmount); // Safely subtract paymentAmount
 
         // Add the payment with the paymentDate to the payments mapping
@@ -21,6 +21,15 @@ contract RodaRoute is ERC721, AccessControl {
     // Creating a mapping to store the issuanceDate for each token Id.
     mapping(uint => uint) public distance;
 
+    // Route parameters, used for recording several routes in a single transaction
+    struct RouteRecord {
+        address to;
+        uint routeId;
+        uint timestampStart;
+        uint timestampEnd;
+        uint distance;
+    }
+
     constructor() ERC721("RodaRoute", "RROUTE") {
         _grantRole(DEFAULT_ADMIN_ROLE, msg.sender);
         _grantRole(MINTER_ROLE, msg.sender);
@@ -35,6 +44,22 @@ contract RodaRoute is ERC721, AccessControl {
     );
 
     function recordRoute(address to, uint routeId, uint _timestampStart, uint _timestampEnd, uint _distance) public onlyRole(MINTER_ROLE) {
+        _recordRoute(to, routeId, _timestampStart, _timestampEnd, _distance);
+    }
+
+    // Function to record several routes in a single transaction, sharing the base transaction cost among them.
+    // Routes already minted are skipped, so a batch partially published by a previous run can be sent again.
+    function recordRouteBatch(RouteRecord[] calldata routes) external onlyRole(MINTER_ROLE) {
+        for (uint i = 0; i < routes.length; ++i) {
+            RouteRecord calldata route = routes[i];
+            if (_exists(route.routeId)) {
+                continue;
+            }
+            _recordRoute(route.to, route.routeId, route.timestampStart, route.timestampEnd, route.distance);
+        }
+    }
+
+    function _recordRoute(address to, uint routeId, uint _timestampStart, uint _timestampEnd, uint _distance) internal {
         timestampStart[routeId] = _timestampStart;
         timestampEnd[routeId] = _timestampEnd;
         distance[routeId] = _distance;
@@ -29,14 +29,101 @@ import argparse
 import logging
 import os
 import re
+import statistics
 import time
-from typing import List, Tuple, Dict, Any
+from operator import itemgetter
+from typing import List, Tuple, Dict, Any, Iterable, Iterator, Optional, Callable
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from airtable import Airtable
 from web3 import Web3, HTTPProvider, Account
+from eth_account.signers.local import LocalAccount
+from hexbytes import HexBytes
 from web3.middleware import geth_poa_middleware
+from web3.exceptions import ContractLogicError, TimeExhausted
 from bip_utils import Bip39SeedGenerator, Bip44, Bip44Coins, Bip44Changes
-from python_utilities.utils import to_unix_timestamp, read_yaml_from_s3, read_json_from_s3, logger, \
-    				setup_local_logger, RODAAPP_BUCKET_PREFIX
+from python_utilities.utils import iso_to_unix_timestamp, read_yaml_from_s3, read_json_from_s3, logger, \
+    				setup_local_logger, get_derived_from_secret, RODAAPP_BUCKET_PREFIX
+
+
+# Enable unaudited HD wallet features in order to allow using the mnemonic features
+Account.enable_unaudited_hdwallet_features()
+
+GAS_PRICE_REFRESH_INTERVAL = 30 # Seconds before the fee estimate fetched from the network is considered stale
+FEE_HISTORY_BLOCKS = 20 # Recent blocks whose priority fees are considered when pricing a transaction
+MAX_GAS_PRICE = Web3.to_wei(100, 'gwei') # Expected gas price above which credits are deferred to the next run
+ISSUE_CREDIT_GAS_LIMIT = 350000 # issueCredit has a fixed storage footprint, its measured cost plus a safety margin
+CREDIT_ISSUANCE_BATCH_SIZE = 20 # Credits issued per issueCreditBatch transaction, far below the block gas limit
+RPC_REQUEST_TIMEOUT = 30 # Seconds
+CELO_BLOCK_TIME = 5 # Seconds between blocks, receipts are never polled less often than this
+RECEIPT_POLL_MAX_FAILURES = 3 # Consecutive failed receipt polls after which the node is considered unavailable
+AIRTABLE_PAGE_SIZE = 100 # Maximum number of records Airtable returns per page
+AIRTABLE_RATE_LIMIT_BACKOFF = 15 # Seconds; urllib3 retries at once, then waits 2, 4, 8 times this: 0, 30, 60, 120 seconds
+AIRTABLE_RATE_LIMIT_RETRIES = 4 # Airtable rejects a base's requests for 30 seconds once it exceeds 5 per second, the
+                                # first retry lands inside that block, the next ones 30 and 90 seconds after it
+S3_CONFIG_CACHE_TTL = 900 # Seconds a credentials or contract file read from S3 is reused before reading it again
+DIGITS_PATTERN = re.compile(r'\d+')
+
+# Credit fields read for every credit, extracted from each record at once by get_credit_fields
+CREDIT_FIELDS = ('ID CRÉDITO', 'ID CLIENTE', 'Inversión', 'Deuda Inicial SUMA', 'Fecha desembolso corregida',
+                 '¿Tiempo para el pago del crédito?')
+get_credit_fields = itemgetter(*CREDIT_FIELDS)
+
+# Pooled HTTP sessions used by the blockchain providers, keyed by provider URL
+RPC_SESSIONS: Dict[str, requests.Session] = {}
+
+# Web3 connections kept across warm Lambda invocations, keyed by provider URL
+WEB3_CONNECTIONS: Dict[str, Web3] = {}
+
+# Contract instances kept across warm Lambda invocations, keyed by (provider URL, contract address)
+CONTRACTS: Dict[Tuple[str, str], Any] = {}
+
+# Airtable clients kept across warm Lambda invocations, keyed by (base_id, table_name, access_token)
+AIRTABLE_TABLES: Dict[Tuple[str, str, str], Airtable] = {}
+
+# Pooled HTTP sessions shared by every Airtable client authenticated with the same access token
+AIRTABLE_SESSIONS: Dict[str, requests.Session] = {}
+
+# BIP44 external chain contexts derived from each mnemonic, kept across warm Lambda invocations, keyed by the
+# mnemonic's SHA-256 digest
+BIP44_CHAIN_CONTEXTS: Dict[bytes, Bip44] = {}
+
+# Accounts derived from each mnemonic, kept across warm Lambda invocations, keyed by the mnemonic's SHA-256 digest
+ACCOUNTS: Dict[bytes, LocalAccount] = {}
+
+# Credentials and contract files read from S3, keyed by S3 path, as (content, read_at)
+S3_CONFIGS: Dict[str, Tuple[Any, float]] = {}
+
+# Last EIP-1559 fees estimated for each blockchain node, keyed by provider URL, as ((base_fee, priority_fee), fetched_at)
+FEE_ESTIMATES: Dict[str, Tuple[Tuple[int, int], float]] = {}
+
+
+class GasPriceTooHighError(Exception):
+    """Exception raised when the network gas price is above MAX_GAS_PRICE."""
+    pass
+
+
+def read_cached_from_s3(reader: Callable[[str], Any], s3_path: str) -> Any:
+    """
+    Reads and parses a configuration file from S3, reusing the content read by a previous call when it is recent.
+
+    Credentials and contract files rarely change, so their parsed content is kept at module level for
+    S3_CONFIG_CACHE_TTL seconds. Warm AWS Lambda invocations skip the S3 GetObject and the parsing, while changes
+    to the files are still picked up within that period.
+
+    Parameters:
+    - reader (Callable[[str], Any]): The function reading and parsing the file, e.g. read_yaml_from_s3.
+    - s3_path (str): The S3 path of the file.
+
+    Returns:
+    - Any: The parsed content of the file, shared with other callers so it must not be modified.
+    """
+    content, read_at = S3_CONFIGS.get(s3_path, (None, 0))
+    if content is None or time.time() - read_at > S3_CONFIG_CACHE_TTL:
+        content = reader(s3_path)
+        S3_CONFIGS[s3_path] = (content, time.time())
+    return content
 
 
 def fetch_celo_credentials(environment: str):
@@ -52,7 +139,7 @@ def fetch_celo_credentials(environment: str):
     Returns:
     - tuple: Contains the mnemonic (str) and provider URL (str) for the specified environment.
     """
-    celo_credentials = read_yaml_from_s3(os.path.join(RODAAPP_BUCKET_PREFIX, "credentials/roda_celo_credentials.yaml"))
+    celo_credentials = read_cached_from_s3(read_yaml_from_s3, os.path.join(RODAAPP_BUCKET_PREFIX, "credentials/roda_celo_credentials.yaml"))
     celo_alfajores_rpc_url = "https://alfajores-forno.celo-testnet.org"
     provider_url = celo_credentials['PROVIDER_URL'] if environment == "production" else celo_alfajores_rpc_url
     return celo_credentials['MNEMONIC'], provider_url
@@ -71,7 +158,7 @@ def fetch_contract_info(environment: str):
     Returns:
     - tuple: Contains the contract address (str) and ABI (list) for route publishing.
     """
-    celo_contracts = read_json_from_s3(os.path.join(RODAAPP_BUCKET_PREFIX, f"credentials/roda_credits_contract_{environment}.json"))
+    celo_contracts = read_cached_from_s3(read_json_from_s3, os.path.join(RODAAPP_BUCKET_PREFIX, f"credentials/roda_credits_contract_{environment}.json"))
     return celo_contracts['RODA_CREDIT_CONTRACT_ADDR'], celo_contracts['RODA_CREDIT_CONTRACT_ABI']
 
 
@@ -82,15 +169,48 @@ def connect_to_blockchain(provider_url: str):
     Utilizes the provided URL to connect to the blockchain via Web3. This connection is essential for
     interacting with the blockchain, including publishing transactions.
 
+    The provider uses a pooled keep-alive session, so every RPC call shares the same TLS connection instead of
+    paying a new handshake. Only connection errors are retried: the request never reached the node in that case,
+    so retrying is safe even for eth_sendRawTransaction. The connection is kept at module level, so warm AWS
+    Lambda invocations reuse it together with the open connections of its session.
+
     Parameters:
     - provider_url (str): The URL of the blockchain provider to connect to.
 
     Returns:
     - Web3: An instance of Web3 connected to the specified blockchain network.
     """
-    web3 = Web3(HTTPProvider(provider_url))
-    web3.middleware_onion.inject(geth_poa_middleware, layer=0)
-    return web3
+    if provider_url not in WEB3_CONNECTIONS:
+        session = requests.Session()
+        session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=16,
+                                              max_retries=Retry(total=3, connect=3, read=0, status=0, backoff_factor=0.3)))
+        RPC_SESSIONS[provider_url] = session
+        web3 = Web3(HTTPProvider(provider_url, session=session, request_kwargs={'timeout': RPC_REQUEST_TIMEOUT}))
+        web3.middleware_onion.inject(geth_poa_middleware, layer=0)
+        WEB3_CONNECTIONS[provider_url] = web3
+    return WEB3_CONNECTIONS[provider_url]
+
+
+def get_contract(web3: Web3, contract_address: str, abi: List[Dict[str, Any]]) -> Any:
+    """
+    Returns the contract instance at the given address, creating it only the first time it is requested.
+
+    Creating the instance parses the whole ABI into contract function classes, so it is kept at module level and
+    warm AWS Lambda invocations reuse it. A contract redeployed with a new ABI gets a new address, and so a new
+    instance.
+
+    Parameters:
+    - web3 (Web3): The Web3 instance connected to the blockchain, as returned by connect_to_blockchain.
+    - contract_address (str): The address of the smart contract.
+    - abi (List[Dict[str, Any]]): The ABI of the contract.
+
+    Returns:
+    - Contract: The contract instance bound to the given Web3 connection.
+    """
+    key = (web3.provider.endpoint_uri, contract_address)
+    if key not in CONTRACTS:
+        CONTRACTS[key] = web3.eth.contract(address=contract_address, abi=abi)
+    return CONTRACTS[key]
 
 
 def fetch_airtable_credentials() -> Tuple[str, str]:
@@ -117,52 +237,331 @@ def fetch_airtable_credentials() -> Tuple[str, str]:
     """
     logger.info("Fetching Airtable credentials...")
     airtable_credentials_path = os.path.join(RODAAPP_BUCKET_PREFIX, "credentials", "roda_airtable_credentials.yaml")
-    airtable_credentials = read_yaml_from_s3(airtable_credentials_path)
+    airtable_credentials = read_cached_from_s3(read_yaml_from_s3, airtable_credentials_path)
     return airtable_credentials['BASE_ID'],  airtable_credentials['PERSONAL_ACCESS_TOKEN']
 
 
-def wait_for_transaction_receipt(web3, tx_hash, poll_interval=10, timeout=300, max_attempts=5):
+def get_airtable_table(base_id: str, table_name: str, access_token: str) -> Airtable:
+    """
+    Returns the Airtable client for the given table, creating it only the first time it is requested.
+
+    The client is kept at module level, so warm AWS Lambda invocations reuse it together with the HTTP session
+    (and its keep-alive connections) that it holds internally. Clients of different tables authenticated with the
+    same access token share a single pooled session, so switching between tables does not open new connections.
+    Connection errors are retried, as for the blockchain provider, and so are the 429 responses Airtable returns
+    when its rate limit is exceeded. urllib3 retries the first failure at once and then waits
+    AIRTABLE_RATE_LIMIT_BACKOFF doubled on every retry, so with AIRTABLE_RATE_LIMIT_RETRIES retries the waits are
+    0, 30, 60 and 120 seconds: the immediate retry still falls inside Airtable's 30 seconds block, but the later
+    ones outlast it instead of failing the run. Requests rejected with a 429 were not processed, so updates are
+    retried as well.
+
+    Parameters:
+    - base_id (str): The Airtable Base ID.
+    - table_name (str): The name of the table within the base.
+    - access_token (str): The personal access token used to authenticate against Airtable.
+
+    Returns:
+    - Airtable: The client configured for the requested table.
+    """
+    key = (base_id, table_name, access_token)
+    if key not in AIRTABLE_TABLES:
+        table = Airtable(base_id, table_name, access_token)
+
+        # The client's own session already carries the authentication for the access token
+        if access_token not in AIRTABLE_SESSIONS:
+            table.session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=4,
+                                                        max_retries=Retry(total=AIRTABLE_RATE_LIMIT_RETRIES, connect=3, read=0,
+                                                                          status=AIRTABLE_RATE_LIMIT_RETRIES,
+                                                                          status_forcelist=[429],
+                                                                          allowed_methods=None, raise_on_status=False,
+                                                                          backoff_factor=AIRTABLE_RATE_LIMIT_BACKOFF)))
+            AIRTABLE_SESSIONS[access_token] = table.session
+        table.session = AIRTABLE_SESSIONS[access_token]
+
+        AIRTABLE_TABLES[key] = table
+    return AIRTABLE_TABLES[key]
+
+
+def get_account(mnemonic: str) -> LocalAccount:
+    """
+    Returns the account derived from the mnemonic, deriving it only the first time it is requested.
+
+    Deriving the account runs PBKDF2 over the mnemonic, so the account is kept at module level and warm AWS
+    Lambda invocations reuse it instead of deriving it again. It is keyed by a hash of the mnemonic, not by the
+    mnemonic itself.
+
+    Parameters:
+    - mnemonic (str): The mnemonic phrase the account is derived from.
+
+    Returns:
+    - LocalAccount: The account used for signing transactions.
+    """
+    return get_derived_from_secret(ACCOUNTS, mnemonic, Account.from_mnemonic)
+
+
+def get_fee_estimate(web3: Web3) -> Tuple[int, int]:
+    """
+    Estimates the EIP-1559 fees of the next block, querying the node only when the cached estimate is stale.
+
+    A single eth_feeHistory call returns the base fee of the next block together with the priority fees paid in the
+    last FEE_HISTORY_BLOCKS blocks; the median of their 25th percentile is used as priority fee, so transactions
+    are priced like the cheaper end of recent ones. The estimate is reused until it gets older than
+    GAS_PRICE_REFRESH_INTERVAL, saving the RPC round-trip for the transactions sent in between.
+
+    Parameters:
+    - web3 (Web3): The Web3 instance connected to the blockchain.
+
+    Returns:
+    - Tuple[int, int]: The base fee of the next block and the priority fee, in wei.
+    """
+    endpoint_uri = web3.provider.endpoint_uri
+    fees, fetched_at = FEE_ESTIMATES.get(endpoint_uri, (None, 0))
+    if fees is None or time.time() - fetched_at > GAS_PRICE_REFRESH_INTERVAL:
+        fee_history = web3.eth.fee_history(FEE_HISTORY_BLOCKS, 'latest', [25])
+        base_fee = fee_history['baseFeePerGas'][-1] # the last entry is the base fee of the next block
+        rewards = [reward[0] for reward in fee_history.get('reward') or []]
+        priority_fee = int(statistics.median(rewards)) if rewards else web3.eth.max_priority_fee
+        fees = (base_fee, priority_fee)
+        FEE_ESTIMATES[endpoint_uri] = (fees, time.time())
+    return fees
+
+
+def check_gas_price(web3: Web3) -> Tuple[int, int]:
+    """
+    Estimates the fees of the next transaction, refusing to go on when the network gas price is spiking.
+
+    Parameters:
+    - web3 (Web3): The Web3 instance connected to the blockchain.
+
+    Returns:
+    - Tuple[int, int]: The base fee of the next block and the priority fee, in wei, as returned by get_fee_estimate.
+
+    Raises:
+    - GasPriceTooHighError: If the expected gas price, base fee plus priority fee, is above MAX_GAS_PRICE.
+    """
+    base_fee, priority_fee = get_fee_estimate(web3)
+    if base_fee + priority_fee > MAX_GAS_PRICE:
+        raise GasPriceTooHighError(f"Expected gas price {Web3.from_wei(base_fee + priority_fee, 'gwei')} gwei is above "
+                                   f"the maximum of {Web3.from_wei(MAX_GAS_PRICE, 'gwei')} gwei")
+    return base_fee, priority_fee
+
+
+def wait_for_transaction_receipt(web3, tx_hash, poll_interval=1, timeout=300):
     """
     Waits for a blockchain transaction to be mined and retrieves the transaction receipt.
 
-    Periodically polls the blockchain for the transaction receipt until it is found or until a timeout is reached.
-    This ensures that a transaction has been successfully processed before proceeding.
+    Relies on web3's own wait_for_transaction_receipt, which polls the blockchain and keeps retrying while the
+    transaction is not found yet, until the receipt is available or the timeout is reached.
 
     Parameters:
     - web3 (Web3): The Web3 instance connected to the blockchain.
     - tx_hash (HexBytes): The hash of the transaction to monitor.
-    - poll_interval (int, optional): Time in seconds between each poll. Defaults to 10.
+    - poll_interval (int, optional): Time in seconds between each poll. Defaults to 1.
     - timeout (int, optional): Maximum time in seconds to wait for the transaction receipt. Defaults to 300.
-    - max_attempts (int, optional): Maximum number of attempts to fetch the transaction receipt. Defaults to 5.
 
     Returns:
-    - dict or None: The transaction receipt if successful, None if timed out or after max attempts without success.
+    - dict or None: The transaction receipt if successful, None if timed out or if fetching the receipt failed.
     """
     logger.info(f"    -> Waiting for transaction to be mined (tx hash: {tx_hash.hex()})")
-    start_time = time.time()
-    attempts = 0
 
-    while True:
+    try:
+        return web3.eth.wait_for_transaction_receipt(tx_hash, timeout=timeout, poll_latency=poll_interval)
+    except TimeExhausted:
+        logger.error(f"    -> Transaction receipt timeout for tx hash: {tx_hash.hex()}")
+    except Exception as e:
+        logger.error(f"    -> Error fetching receipt for tx hash: {tx_hash.hex()}: {e}")
+
+    return None
+
+
+def wait_for_transaction_receipts(web3, tx_hashes, initial_poll_interval=0.5, max_poll_interval=CELO_BLOCK_TIME, timeout=300):
+    """
+    Waits for several blockchain transactions to be mined and retrieves their transaction receipts.
+
+    Every poll asks for the receipts of all the transactions still pending in a single JSON-RPC batch request,
+    instead of one request per transaction. Polls back off geometrically from a short initial interval up to the
+    block time, so receipts are picked up soon after they are mined without polling faster than needed on long
+    waits. A failed poll is retried with the same backoff, but after RECEIPT_POLL_MAX_FAILURES consecutive failures
+    the node is considered unavailable and the remaining receipts are given up, instead of spending the rest of the
+    timeout against it. If the node does not support batch requests, each receipt is awaited on its own with
+    wait_for_transaction_receipt.
+
+    Parameters:
+    - web3 (Web3): The Web3 instance connected to the blockchain, as returned by connect_to_blockchain.
+    - tx_hashes (List[HexBytes]): The hashes of the transactions to monitor.
+    - initial_poll_interval (float, optional): Time in seconds before the second poll. Defaults to 0.5.
+    - max_poll_interval (float, optional): Maximum time in seconds between polls. Defaults to CELO_BLOCK_TIME.
+    - timeout (int, optional): Maximum time in seconds to wait for all the transaction receipts. Defaults to 300.
+
+    Returns:
+    - List[dict or None]: The receipt of each transaction, in the same order as tx_hashes, as returned by the
+                          JSON-RPC API except for its 'status' which is converted to int. None for the transactions
+                          whose receipt was not found before the timeout or could not be fetched.
+    """
+    endpoint_uri = web3.provider.endpoint_uri
+    session = RPC_SESSIONS[endpoint_uri]
+    tx_receipts = [None] * len(tx_hashes)
+    pending = set(range(len(tx_hashes)))
+    start_time = time.time()
+    poll_interval = initial_poll_interval
+    consecutive_failures = 0
+
+    while pending:
+        batch_request = [
+            {'jsonrpc': '2.0', 'method': 'eth_getTransactionReceipt', 'params': [tx_hashes[index].hex()], 'id': index}
+            for index in sorted(pending)
+        ]
         try:
-            logger.info("        -> still wating for transaction to be mined")
-            tx_receipt = web3.eth.get_transaction_receipt(tx_hash)
-            if tx_receipt:
-                return tx_receipt
+            response = session.post(endpoint_uri, json=batch_request, timeout=RPC_REQUEST_TIMEOUT)
+            response.raise_for_status()
+            batch_response = response.json()
+            consecutive_failures = 0
         except Exception as e:
-            error_message = str(e)
-            if "not found" in error_message and attempts < max_attempts:
-                logger.warning(f"    -> Transaction {tx_hash.hex()} not found. Retrying...")
-                attempts += 1
-            else:
-                # Handle other errors or give up after max_attempts
-                logger.error(f"    -> Error fetching receipt for tx hash: {tx_hash.hex()}: {e}")
-                return None
+            consecutive_failures += 1
+            if consecutive_failures >= RECEIPT_POLL_MAX_FAILURES:
+                logger.error(f"    -> Error fetching receipts for {len(pending)} transactions, giving up after "
+                             f"{consecutive_failures} failed polls: {e}")
+                return tx_receipts
+            logger.warning(f"    -> Error fetching receipts for {len(pending)} transactions, retrying: {e}")
+            batch_response = []
+
+        if not isinstance(batch_response, list):
+            logger.warning("    -> The blockchain node does not support batch requests, waiting for each receipt.")
+            for index in sorted(pending):
+                tx_receipts[index] = wait_for_transaction_receipt(web3, tx_hashes[index], timeout=timeout)
+            return tx_receipts
+
+        for item in batch_response:
+            tx_receipt = item.get('result')
+            if tx_receipt:
+                tx_receipt['status'] = int(tx_receipt['status'], 16)
+                tx_receipts[item['id']] = tx_receipt
+                pending.discard(item['id'])
+
+        if not pending:
+            break
 
         if time.time() - start_time > timeout:
-            logger.error(f"    -> Transaction receipt timeout for tx hash: {tx_hash.hex()}")
-            return None
+            logger.error(f"    -> Transaction receipt timeout for {len(pending)} transactions")
+            break
 
+        # Logged once per poll, so it is kept at DEBUG level to avoid flooding the logs
+        logger.debug("        -> still waiting for %s transactions to be mined", len(pending))
         time.sleep(poll_interval)
+        poll_interval = min(poll_interval * 1.5, max_poll_interval)
+
+    return tx_receipts
+
+
+def send_raw_transactions(web3, raw_transactions):
+    """
+    Sends several signed transactions to the blockchain in a single JSON-RPC batch request.
+
+    The node processes the transactions of the batch in order, so consecutive nonces reach the mempool in the
+    same order as if they were sent one by one, without a round-trip per transaction. If the node does not support
+    batch requests, the transactions are sent one by one with send_raw_transaction.
+
+    Parameters:
+    - web3 (Web3): The Web3 instance connected to the blockchain, as returned by connect_to_blockchain.
+    - raw_transactions (List[HexBytes]): The signed transactions to send, ordered by nonce.
+
+    Returns:
+    - List[HexBytes or None]: The hash of each transaction, in the same order as raw_transactions. None for the
+                              transactions rejected by the node and, since their nonces would leave a gap, for every
+                              transaction after them; also for all of them if the request itself failed.
+    """
+    if not raw_transactions:
+        return []
+    endpoint_uri = web3.provider.endpoint_uri
+    session = RPC_SESSIONS[endpoint_uri]
+    tx_hashes = [None] * len(raw_transactions)
+
+    batch_request = [
+        {'jsonrpc': '2.0', 'method': 'eth_sendRawTransaction', 'params': [Web3.to_hex(raw_transaction)], 'id': index}
+        for index, raw_transaction in enumerate(raw_transactions)
+    ]
+    try:
+        response = session.post(endpoint_uri, json=batch_request, timeout=RPC_REQUEST_TIMEOUT)
+        response.raise_for_status()
+        batch_response = response.json()
+    except Exception as e:
+        logger.error(f"    -> Error sending {len(raw_transactions)} transactions: {e}")
+        return tx_hashes
+
+    if not isinstance(batch_response, list):
+        logger.warning("    -> The blockchain node does not support batch requests, sending each transaction.")
+        for index, raw_transaction in enumerate(raw_transactions):
+            try:
+                tx_hashes[index] = web3.eth.send_raw_transaction(raw_transaction)
+            except Exception as e:
+                logger.error(f"    -> Error sending transaction {index + 1} of {len(raw_transactions)}: {e}")
+                break
+        return tx_hashes
+
+    for item in sorted(batch_response, key=lambda item: item['id']):
+        if 'error' in item:
+            logger.error(f"    -> Error sending transaction {item['id'] + 1} of {len(raw_transactions)}: "
+                         f"{item['error'].get('message')}")
+            break
+        tx_hashes[item['id']] = HexBytes(item['result'])
+
+    return tx_hashes
+
+
+def call_contract_functions(web3, contract, calls):
+    """
+    Calls several read-only functions of a contract in a single JSON-RPC batch request.
+
+    Each call is encoded as an eth_call against the latest block, and its output is decoded with the function's ABI,
+    so the results match those of calling each function with .call(), without a round-trip per call. If the node does
+    not support batch requests, each function is called on its own.
+
+    Parameters:
+    - web3 (Web3): The Web3 instance connected to the blockchain, as returned by connect_to_blockchain.
+    - contract (Contract): The contract whose functions are called.
+    - calls (List[Tuple[str, Tuple]]): The name and the arguments of each function to call.
+
+    Returns:
+    - List[Any]: The result of each call, in the same order as calls. Functions with a single output return it
+                 directly, the rest return a tuple.
+
+    Raises:
+    - ValueError: If the request fails or any of the calls is rejected by the node.
+    """
+    if not calls:
+        return []
+
+    endpoint_uri = web3.provider.endpoint_uri
+    session = RPC_SESSIONS[endpoint_uri]
+    batch_request = [
+        {'jsonrpc': '2.0', 'method': 'eth_call', 'id': index,
+         'params': [{'to': contract.address, 'data': contract.encodeABI(fn_name=fn_name, args=list(args))}, 'latest']}
+        for index, (fn_name, args) in enumerate(calls)
+    ]
+    try:
+        response = session.post(endpoint_uri, json=batch_request, timeout=RPC_REQUEST_TIMEOUT)
+        response.raise_for_status()
+        batch_response = response.json()
+    except Exception as e:
+        raise ValueError(f"Error calling {len(calls)} contract functions: {e}") from e
+
+    if not isinstance(batch_response, list):
+        logger.warning("    -> The blockchain node does not support batch requests, calling each contract function.")
+        try:
+            return [contract.functions[fn_name](*args).call() for fn_name, args in calls]
+        except Exception as e:
+            raise ValueError(f"Error calling {len(calls)} contract functions: {e}") from e
+
+    results = [None] * len(calls)
+    for item in batch_response:
+        fn_name, args = calls[item['id']]
+        if 'error' in item:
+            raise ValueError(f"Error calling {fn_name}{tuple(args)}: {item['error'].get('message')}")
+        output_types = [output['type'] for output in contract.get_function_by_name(fn_name).abi['outputs']]
+        result = web3.codec.decode(output_types, HexBytes(item['result']))
+        results[item['id']] = result[0] if len(result) == 1 else result
+
+    return results
 
 
 def parse_days_from_credit_repayment(days_from_credit_repayment: str) -> int:
@@ -176,8 +575,13 @@ def parse_days_from_credit_repayment(days_from_credit_repayment: str) -> int:
     Returns:
     - int: The extracted number of days as an integer.
     """
-    # Use regular expression to find the first sequence of digits in the string
-    match = re.search(r'\d+', days_from_credit_repayment)
+    # The value almost always starts with the number, which is parsed without going through the regex engine
+    head = days_from_credit_repayment.split(' ', 1)[0]
+    if head.isdecimal():
+        return int(head)*7
+
+    # Otherwise use regular expression to find the first sequence of digits in the string
+    match = DIGITS_PATTERN.search(days_from_credit_repayment)
     if match:
         days_parsed = int(match.group(0))*7
         # Convert the matched string to an integer and return it
@@ -187,11 +591,84 @@ def parse_days_from_credit_repayment(days_from_credit_repayment: str) -> int:
         raise ValueError("No digits found in input string.")
 
 
+def is_credit_minted(contract, credit_id: int) -> bool:
+    """
+    Checks whether the credit token has already been minted on the blockchain.
+
+    Parameters:
+    - contract (Contract): The credits smart contract instance.
+    - credit_id (int): The credit id, which is also the ERC721 token id.
+
+    Returns:
+    - bool: True if the token has an owner, False if the contract reports it as nonexistent.
+    """
+    try:
+        contract.functions.ownerOf(credit_id).call()
+        return True
+    except ContractLogicError:
+        return False
+
+
+def send_credit_transaction(
+    web3: Web3,
+    contract: Any,
+    credit_batch: List[Tuple[str, int, Tuple]],
+    use_batch_issuance: bool,
+    account_address: str,
+    private_key: bytes,
+    nonce: int,
+    base_fee: int,
+    priority_fee: int
+) -> HexBytes:
+    """
+    Builds, signs and sends the transaction that issues a batch of credits on the Celo blockchain.
+
+    When the contract supports batch issuance, the whole batch is issued by a single issueCreditBatch call, so the
+    base transaction cost, the signature and the nonce are shared by every credit in it. Otherwise the batch holds
+    a single credit, which is issued through issueCredit.
+
+    Parameters:
+    - web3 (Web3): An instance of the Web3 class, connected to the Celo blockchain.
+    - contract (Contract): The credits contract instance.
+    - credit_batch (List[Tuple[str, int, Tuple]]): The credits to issue, each one as a tuple of its Airtable record id,
+                                                   its credit id and the issuance arguments expected by the contract.
+    - use_batch_issuance (bool): Whether the contract supports the issueCreditBatch function.
+    - account_address (str): The address of the account sending the transaction.
+    - private_key (bytes): The private key used to sign the transaction.
+    - nonce (int): The nonce of the transaction.
+    - base_fee (int): The estimated base fee of the next block.
+    - priority_fee (int): The priority fee offered to the block producer.
+
+    Returns:
+    HexBytes: The hash of the sent transaction.
+    """
+    if use_batch_issuance:
+        contract_call = contract.functions.issueCreditBatch([issuance for _, _, issuance in credit_batch])
+    else:
+        _, _, issuance = credit_batch[0]
+        contract_call = contract.functions.issueCredit(*issuance)
+
+    tx = contract_call.build_transaction({
+        'from': account_address,
+        'nonce': nonce,
+        'gas': ISSUE_CREDIT_GAS_LIMIT * len(credit_batch),
+        # Twice the base fee keeps the transaction valid through several blocks of rising base fees, while
+        # only the actual base fee plus the priority fee is charged
+        'maxFeePerGas': 2 * base_fee + priority_fee,
+        'maxPriorityFeePerGas': priority_fee
+    })
+
+    # Sign the transaction directly with the private key extracted once by the caller
+    signed_tx = Account.sign_transaction(tx, private_key)
+
+    return web3.eth.send_raw_transaction(signed_tx.rawTransaction)
+
+
 def publish_to_celo(
     web3: Web3, 
     contract_address: str, 
     abi: List[Dict[str, Any]], 
-    credit_records: List[Dict[str, Any]], 
+    credit_pages: Iterable[List[Dict[str, Any]]], 
     credits_table: Airtable,
     contacts_table: Airtable, 
     mnemonic: str, 
@@ -200,16 +677,27 @@ def publish_to_celo(
     """
     Publishes credit records to the Celo blockchain by creating transactions for each credit.
 
-    This function iterates through a list of credit records, constructs and signs transactions using the provided
+    This function iterates through pages of credit records, constructs and signs transactions using the provided
     mnemonic, and publishes each transaction to the Celo blockchain. It handles the derivation of Celo addresses,
     calculates necessary transaction parameters (e.g., gas), and ensures transactions are successfully mined.
     Additionally, it updates the publication status in Airtable to prevent re-publishing of already processed credits.
 
+    When the contract ABI includes issueCreditBatch, credits are grouped in batches of up to CREDIT_ISSUANCE_BATCH_SIZE
+    and each batch is issued by a single transaction; otherwise every credit is issued by its own transaction.
+
+    Publishing runs in two phases: first every transaction is signed and sent with a locally incremented nonce,
+    without waiting for it to be mined; then the receipts are awaited together and processed in nonce order. This way the total wall time
+    is bound by the confirmation of the last transaction instead of the sum of every confirmation. Transactions use
+    the fixed ISSUE_CREDIT_GAS_LIMIT per credit instead of a gas estimation, and EIP-1559 fees; if the expected gas
+    price goes above MAX_GAS_PRICE no more transactions are sent, leaving the remaining credits for the next run.
+
     Parameters:
     - web3 (Web3): An instance of the Web3 class, connected to the Celo blockchain.
     - contract_address (str): The address of the smart contract on the Celo blockchain to interact with.
     - abi (List[Dict[str, Any]]): The ABI (Application Binary Interface) of the contract, defining how to interact with it.
-    - credit_records (List[Dict[str, Any]]): A list of dictionaries, each representing a credit record to be published.
+    - credit_pages (Iterable[List[Dict[str, Any]]]): An iterable of pages of credit records to be published, each
+                                                     record being a dictionary. It can be a generator, so credits are
+                                                     sent while the next Airtable page is still pending.
     - credits_table (Airtable): An instance of the Airtable class for accessing the credits table.
     - contacts_table (Airtable): An instance of the Airtable class for accessing the contacts table.
     - mnemonic (str): The mnemonic phrase used to derive blockchain addresses and sign transactions.
@@ -233,132 +721,154 @@ def publish_to_celo(
     - Transactions are constructed and signed using the account derived from the provided mnemonic. This requires
       enabling unaudited HD wallet features in the Web3.py library.
     """
-    logger.info(f"About to publish {len(credit_records)} transactions...")
-    contract = web3.eth.contract(address=contract_address, abi=abi)
-
-
-    # Enable unaudited HD wallet features in order to allow using the mnemonic features
-    Account.enable_unaudited_hdwallet_features()
+    logger.info("About to publish transactions...")
+    contract = get_contract(web3, contract_address, abi)
+    use_batch_issuance = any(item.get('name') == 'issueCreditBatch' for item in abi)
+    batch_size = CREDIT_ISSUANCE_BATCH_SIZE if use_batch_issuance else 1
 
     # Derive the account from the mnemonic
-    account = Account.from_mnemonic(mnemonic)
-    nonce = web3.eth.get_transaction_count(account.address)
+    account = get_account(mnemonic)
+    account_address = account.address
+    private_key = account.key
+    nonce = web3.eth.get_transaction_count(account_address)
 
     all_success = True
     count_published_routes = 0
-    cache_celo_address = dict()
-    
-    # Iterate over the data and publish each row to Celo
-    for credit in credit_records:
-        try:
-            credit_record_id = credit['id']
-            credit_fields = credit['fields']
-            id_credit = int(credit_fields['ID CRÉDITO'])
-            client_record_id = credit_fields['ID CLIENTE'][0]
-            Investment = int(credit_fields['Inversión'])
-            initial_debt = int(credit_fields['Deuda Inicial SUMA'])
+    celo_addresses = dict()
+    credit_batch = []
+    pending_transactions = []
+    published_record_ids = []
+    submission_error = None
+    id_credit = None
+    count_credits = 0
+
+    def send_credit_batch():
+        # Sends the pending credit batch with the next nonce, its receipt is collected in the second phase
+        nonlocal credit_batch, nonce
+        base_fee, priority_fee = check_gas_price(web3)
+        tx_hash = send_credit_transaction(web3, contract, credit_batch, use_batch_issuance, account_address,
+                                          private_key, nonce, base_fee, priority_fee)
+        logger.info("    -> Sent transaction for %s credits with: nonce = %s, base_fee = %s, priority_fee = %s, "
+                    "and tx_hash = %s", len(credit_batch), nonce, base_fee, priority_fee, tx_hash.hex())
+        pending_transactions.append((credit_batch, tx_hash))
+        credit_batch = []
+
+        # Increment the nonce for subsequent transactions
+        nonce += 1
+
+    # Phase 1: sign and send every transaction without waiting for it to be mined. The nonce is
+    # incremented locally, so the whole batch reaches the mempool back-to-back.
+    try:
+        for credit_page in credit_pages:
+            # Clients without a Celo address get one generated for the whole page at once
+            update_client_celo_addresses(contacts_table, credit_page, mnemonic, celo_addresses)
+
+            for credit in credit_page:
+                credit_record_id = credit['id']
+                credit_fields = credit['fields']
+                id_credit, client_record_ids, Investment, initial_debt, disbursement_date, time_for_credit_repayment = \
+                    get_credit_fields(credit_fields)
+                id_credit = int(id_credit)
+                client_record_id = client_record_ids[0]
+                Investment = int(Investment)
+                initial_debt = int(initial_debt)
             
-            disbursement_date = credit_fields['Fecha desembolso corregida']
-            disbursement_date = disbursement_date[:-1] if disbursement_date.endswith('Z') else disbursement_date
-            disbursement_date = to_unix_timestamp(disbursement_date, "%Y-%m-%dT%H:%M:%S.%f")
-
-            time_for_credit_repayment = int(parse_days_from_credit_repayment(credit_fields['¿Tiempo para el pago del crédito?']))
-            client_celo_address = credit_fields.get('ClientCeloAddress', [None])[0]
-            is_published_to_celo = credit_fields.get(f'PublishedToCelo{env.capitalize()}', False)
-
-            if not client_celo_address:
-                if client_record_id not in cache_celo_address:
-                    client_id = contacts_table.get(client_record_id)['fields'].get('ID CLIENTE')
-                    client_celo_address = generate_celo_address(mnemonic, client_id)
-                    update_client_celo_address(contacts_table, client_record_id, client_celo_address)
-                    cache_celo_address[client_record_id] = client_celo_address
+                disbursement_date = iso_to_unix_timestamp(disbursement_date)
+
+                time_for_credit_repayment = int(parse_days_from_credit_repayment(time_for_credit_repayment))
+                client_celo_address = get_client_celo_address(credit_fields) or celo_addresses[client_record_id]
+
+                logger.info("Publishing credit id %s:", id_credit)
+                count_credits += 1
+                credit_batch.append((credit_record_id, id_credit, (client_celo_address, id_credit, Investment, initial_debt,
+                                                                   disbursement_date, time_for_credit_repayment)))
+
+                if len(credit_batch) == batch_size:
+                    send_credit_batch()
+
+        # Send the last, incomplete batch
+        if credit_batch:
+            send_credit_batch()
+
+    except GasPriceTooHighError as e:
+        # Not an error of the credits themselves: they are left unpublished, to be sent on a later run
+        logger.warning(f"    -> {e}. Deferring the remaining credits to the next run.")
+        all_success = False
+
+    except Exception as e:
+        logger.error(f"    -> Error publishing credit id {id_credit}. Stopping further transactions.")
+        all_success = False
+        submission_error = e
+
+    logger.info(f"Sent {len(pending_transactions)} transactions for {count_credits} credits.")
+
+    # Phase 2: wait for every receipt at once, polling all the pending ones in a single batch request, so each
+    # one is picked up on the first poll after it is mined. Receipts are then processed in nonce order; credits
+    # are only marked as published once their receipt is confirmed, and the first failure leaves that batch and
+    # every later one unpublished so they are retried on the next run.
+    logger.info(f"Waiting for {len(pending_transactions)} transactions to be mined...")
+    tx_receipts = wait_for_transaction_receipts(web3, [tx_hash for _, tx_hash in pending_transactions])
+
+    for index, ((credit_batch, tx_hash), tx_receipt) in enumerate(zip(pending_transactions, tx_receipts)):
+        if not tx_receipt:
+            logger.error(f"    -> Failed to get receipt for tx hash {tx_hash.hex()}. "
+                         f"Leaving {len(pending_transactions) - index} transactions as unpublished.")
+            all_success = False
+            break
+
+        if tx_receipt['status'] == 0:
+            # Without a gas estimation up front, a credit minted by a previous run is only detected once its
+            # transaction reverts on-chain. The nonce is consumed anyway, so the rest of the batch is unaffected.
+            for credit_record_id, id_credit, _ in credit_batch:
+                if is_credit_minted(contract, id_credit):
+                    logger.info(f"    -> Token already minted for credit id {id_credit}. Continuing with next credit.")
+                    published_record_ids.append(credit_record_id)
                 else:
-                    client_celo_address = cache_celo_address[client_record_id]
-
-            logger.info(f"Publishing credit id {id_credit}:")
-
-            # Check if the route has already been published and skip if it has
-            if is_published_to_celo:
-                logger.info(f"    -> Credit id {id_credit} is already published. Skipping re-publishing.")
-                continue
-
-            # Estimate gas for the transaction
-            estimated_gas = contract.functions.issueCredit(
-                                to=client_celo_address,
-                                creditId=id_credit,
-                                _principal=Investment,
-                                totalRepaymentAmount=initial_debt,
-                                _issuanceDate=disbursement_date,
-                                _creditTerm=time_for_credit_repayment
-                            ).estimate_gas({'from': account.address})
-
-            gas_price = web3.eth.gas_price
-
-            tx = contract.functions.issueCredit(
-                to=client_celo_address,
-                creditId=id_credit,
-                _principal=Investment,
-                totalRepaymentAmount=initial_debt,
-                _issuanceDate=disbursement_date,
-                _creditTerm=time_for_credit_repayment
-            ).build_transaction({
-                'from': account.address,
-                'nonce': nonce,
-                'gas': estimated_gas + 100000,  # extra margin for gas
-                'gasPrice': gas_price
-            })
-
-            # Sign the transaction
-            signed_tx = account.sign_transaction(tx)
-            tx_hash = Web3.keccak(signed_tx.rawTransaction)
-            
-            logger.info(f"    -> with: nonce = {nonce}, gas_price = {gas_price}, and tx_hash = {tx_hash.hex()}")
+                    logger.error(f"    -> Transaction reverted for credit id {id_credit}, hash {tx_hash.hex()}")
+                    all_success = False
+            continue
 
-            # Send the transaction
-            tx_hash = web3.eth.send_raw_transaction(signed_tx.rawTransaction)
-            logger.info(f"    -> Sent transaction for credit id {id_credit}, awaiting receipt...")
+        for credit_record_id, id_credit, _ in credit_batch:
+            logger.info("    -> Transaction successfully sent: credit id %s, hash %s", id_credit, tx_hash.hex())
+            published_record_ids.append(credit_record_id)
 
-            # Wait until transaction is successfully receipt
-            time.sleep(2) # wait 2 seconds before verifying transaction receipt
-            tx_receipt = wait_for_transaction_receipt(web3, tx_hash)
+    if published_record_ids:
+        set_credits_as_published(credits_table, published_record_ids, env)
+        count_published_routes = len(published_record_ids)
 
-            if not tx_receipt:
-                logger.error(f"    -> Failed to get receipt for credit id {id_credit}. Stopping further transactions.")
-                all_success = False
-                break
+    if submission_error:
+        raise submission_error
 
-            logger.info(f"    -> Transaction successfully sent: credit id {id_credit}, hash {tx_hash.hex()}")
-            set_credit_as_published(credits_table, credit_record_id, env)
-            count_published_routes += 1
+    return all_success, count_published_routes
 
-            # Increment the nonce for subsequent transactions
-            nonce += 1
 
-        except Exception as e:
-            error_message = str(e)
-            if "ERC721: token already minted" in error_message:
-                logger.info(f"    -> Token already minted for credit id {id_credit}. Continuing with next transaction.")
-                set_credit_as_published(credits_table, credit_record_id, env)
-                count_published_routes += 1
-                continue
-            else:
-                logger.error(f"    -> Error publishing credit id {id_credit}")
-                all_success = False
-                raise e
+def get_bip44_chain_context(mnemonic: str) -> Bip44:
+    """
+    Returns the BIP44 context of the external chain derived from the mnemonic, deriving it only the first time.
 
-    return all_success, count_published_routes
+    Deriving the seed runs PBKDF2 over the mnemonic and deriving the account path chains several HMAC-SHA512
+    operations, while deriving one more address index from the external chain context is a single step. The
+    context is kept at module level, so it is also reused across warm AWS Lambda invocations. It is keyed by a hash
+    of the mnemonic, not by the mnemonic itself.
 
+    Args:
+    mnemonic (str): The mnemonic phrase the addresses are derived from.
 
-def generate_celo_address(mnemonic, index=0):
+    Returns:
+    Bip44: The BIP44 context of the external chain of the first account, for the Ethereum coin type used by Celo.
     """
-    Generates a Celo address from a mnemonic and an index.
+    return get_derived_from_secret(BIP44_CHAIN_CONTEXTS, mnemonic, derive_bip44_chain_context)
+
+
+def derive_bip44_chain_context(mnemonic: str) -> Bip44:
+    """
+    Derives the BIP44 context of the external chain from the mnemonic.
 
     Args:
-    celo_credentials (dict): Dictionary containing the mnemonic.
-    index (int): Index to alter the derivation path for different addresses.
+    mnemonic (str): The mnemonic phrase the addresses are derived from.
 
     Returns:
-    str: A Celo blockchain address.
+    Bip44: The BIP44 context of the external chain of the first account, for the Ethereum coin type used by Celo.
     """
     # Generate seed from mnemonic
     seed = Bip39SeedGenerator(mnemonic).Generate()
@@ -366,17 +876,31 @@ def generate_celo_address(mnemonic, index=0):
     # Generate the Bip44 wallet for the Celo coin
     bip44_mst_ctx = Bip44.FromSeed(seed, Bip44Coins.ETHEREUM)
 
-    # Derive the address at the specified index
+    # Derive the external chain of the first account, addresses are derived from it by index
     bip44_acc_ctx = bip44_mst_ctx.Purpose().Coin().Account(0)
-    bip44_chg_ctx = bip44_acc_ctx.Change(Bip44Changes.CHAIN_EXT)
-    bip44_addr_ctx = bip44_chg_ctx.AddressIndex(index)
+    return bip44_acc_ctx.Change(Bip44Changes.CHAIN_EXT)
+
+
+def generate_celo_address(mnemonic, index=0):
+    """
+    Generates a Celo address from a mnemonic and an index.
+
+    Args:
+    celo_credentials (dict): Dictionary containing the mnemonic.
+    index (int): Index to alter the derivation path for different addresses.
+
+    Returns:
+    str: A Celo blockchain address.
+    """
+    # Derive the address at the specified index
+    bip44_addr_ctx = get_bip44_chain_context(mnemonic).AddressIndex(index)
 
     return bip44_addr_ctx.PublicKey().ToAddress()
 
 
-def fetch_non_published_credits_from_airtable(credits_table: Airtable, env: str):
+def iter_non_published_credits_from_airtable(credits_table: Airtable, env: str) -> Iterator[List[Dict[str, Any]]]:
     """
-    Retrieves a list of credit records from Airtable that have not yet been published to the Celo blockchain.
+    Yields pages of the credit records from Airtable that have not yet been published to the Celo blockchain.
 
     This function queries the Airtable credits table to find all records that are marked as not published
     according to the 'PublishedToCeloStaging' or 'PublishedToCeloProduction' column, depending on the
@@ -388,60 +912,112 @@ def fetch_non_published_credits_from_airtable(credits_table: Airtable, env: str)
     - env (str): The environment context ('staging' or 'production') which influences the filter criteria
                  for fetching non-published credits.
 
-    Returns:
-    list[dict]: A list of credit records that have not been marked as published in the specified environment.
-                Each record is represented as a dictionary.
+    Yields:
+    list[dict]: Each page of credit records that have not been marked as published in the specified environment.
+                Only one Airtable page is held in memory, and the first credits can be published before the
+                following pages are requested.
+
+    Note:
+    Only the listed fields are transferred, regardless of the columns defined in the view; the view is kept because
+    it scopes which credits belong to the pipeline. The published field is only used by the server-side formula, it
+    is not transferred since it is always unchecked in the returned records. Airtable paginates with an opaque offset
+    returned by the previous page, so pages cannot be requested concurrently; instead each request asks for the
+    largest page Airtable allows, keeping the number of sequential round-trips to a minimum.
     """
     logger.info("Fetching creditos from airtable (view CREDIT_TO_CELO_PIPELINE_VIEW)...")
     published_to_celo_field_name = f'PublishedToCelo{env.capitalize()}'
-    credit_records = credits_table.get_all(
+    count_credits = 0
+    for page in credits_table.get_iter(
         view='CREDIT_TO_CELO_PIPELINE_VIEW', 
-        fields=['ID CRÉDITO', 'ID CLIENTE', 'Inversión', 'Deuda Inicial SUMA', 'Fecha desembolso corregida', '¿Tiempo para el pago del crédito?',
-                'ClientCeloAddress', published_to_celo_field_name],
-        formula=f'{{{published_to_celo_field_name}}}=0'
-        )
-    logger.info(f"    --> Fetched {len(credit_records)} credits.")
-    return credit_records
+        fields=[*CREDIT_FIELDS, 'ClientCeloAddress'],
+        formula=f'{{{published_to_celo_field_name}}}=0',
+        page_size=AIRTABLE_PAGE_SIZE
+        ):
+        count_credits += len(page)
+        logger.info(f"    --> Fetched a page of {len(page)} credits ({count_credits} so far).")
+        yield page
 
 
-def update_client_celo_address(contacts_table: Airtable, record_id: str, celo_address: str):
+def get_client_celo_address(credit_fields: Dict[str, Any]) -> Optional[str]:
     """
-    Updates a client's Celo address in the Airtable contacts table.
+    Returns the client's Celo address looked up from the contacts table into a credit record.
 
-    This function is responsible for updating the 'Celo Address' field of a specific contact record, identified
-    by its record ID, with a new Celo address. This operation is crucial for ensuring that the contact information
-    is current and accurate, reflecting the latest Celo address that should be used for transactions.
+    'ClientCeloAddress' is a lookup field, so Airtable returns it as a list with the address of the linked contact.
+    The field is omitted when the contact has no address yet, and comes back as an empty list when the lookup has
+    no value; both cases are reported as None instead of raising.
+
+    Parameters:
+    - credit_fields (Dict[str, Any]): The fields of a credit record, as returned by Airtable.
+
+    Returns:
+    - str or None: The client's Celo address, or None when the client does not have one yet.
+    """
+    client_celo_addresses = credit_fields.get('ClientCeloAddress')
+    return client_celo_addresses[0] if client_celo_addresses else None
+
+
+def update_client_celo_addresses(contacts_table: Airtable, credit_page: List[Dict[str, Any]], mnemonic: str,
+                                 celo_addresses: Dict[str, str]):
+    """
+    Generates and stores in Airtable the Celo address of every client in a page of credits who does not have one yet.
+
+    The contacts of all the clients missing a Celo address are fetched with a single request, their addresses are
+    generated from the mnemonic and stored back in the contacts table in batches of 10 records, instead of paying
+    one request to fetch and another one to update each contact.
 
     Parameters:
     - contacts_table (Airtable): An instance of the Airtable class, configured to interact with the contacts table.
-    - record_id (str): The unique identifier of the contact record to update in the Airtable.
-    - celo_address (str): The new Celo blockchain address to be associated with the contact.
+    - credit_page (List[Dict[str, Any]]): A page of credit records, as returned by Airtable.
+    - mnemonic (str): The mnemonic phrase used to derive the clients' Celo addresses.
+    - celo_addresses (Dict[str, str]): The Celo addresses generated so far, keyed by contact record id. It is updated
+                                       in place with the addresses generated for this page.
 
     Returns:
-    dict: The response from the Airtable API after updating the record, which includes the updated fields.
+    None
     """
-    return contacts_table.update(record_id, {'Celo Address': celo_address})
+    missing_client_record_ids = {
+        credit['fields']['ID CLIENTE'][0] for credit in credit_page
+        if not get_client_celo_address(credit['fields'])
+    } - celo_addresses.keys()
+    if not missing_client_record_ids:
+        return
+
+    logger.info(f"Generating celo addresses for {len(missing_client_record_ids)} clients...")
+    contacts = contacts_table.get_all(
+        fields=['ID CLIENTE'],
+        formula="OR(" + ",".join(f"RECORD_ID()='{record_id}'" for record_id in missing_client_record_ids) + ")"
+        )
+
+    records_to_update = []
+    for contact in contacts:
+        celo_address = generate_celo_address(mnemonic, contact['fields'].get('ID CLIENTE'))
+        celo_addresses[contact['id']] = celo_address
+        records_to_update.append({'id': contact['id'], 'fields': {'Celo Address': celo_address}})
 
+    contacts_table.batch_update(records_to_update)
 
-def set_credit_as_published(credits_table: Airtable, record_id: str, env: str):
+
+def set_credits_as_published(credits_table: Airtable, record_ids: List[str], env: str):
     """
-    Marks a credit record in Airtable as published to the Celo blockchain by updating the appropriate column
+    Marks credit records in Airtable as published to the Celo blockchain by updating the appropriate column
     based on the execution environment.
 
-    This function targets a specific record, identified by its record ID, and updates its status to indicate
-    that it has been successfully published. This is achieved by setting the 'PublishedToCeloStaging' or
+    This function targets the given records, identified by their record IDs, and updates their status to indicate
+    that they have been successfully published. This is achieved by setting the 'PublishedToCeloStaging' or
     'PublishedToCeloProduction' column to True, depending on whether the function is operating in a staging
-    or production environment.
+    or production environment. Records are updated in batches of 10, the maximum Airtable accepts per request.
 
     Parameters:
     - credits_table (Airtable): An instance of the Airtable class, configured to interact with the credits table.
-    - record_id (str): The unique identifier of the credit record to update in the Airtable.
+    - record_ids (List[str]): The unique identifiers of the credit records to update in the Airtable.
     - env (str): The environment context ('staging' or 'production') that dictates which column to update.
 
     Returns:
-    dict: The response from the Airtable API after updating the record, which includes the updated fields.
+    list: The responses from the Airtable API after updating the records, which include the updated fields.
     """
-    return credits_table.update(record_id, {f'PublishedToCelo{env.capitalize()}': True})
+    published_to_celo_field_name = f'PublishedToCelo{env.capitalize()}'
+    return credits_table.batch_update([{'id': record_id, 'fields': {published_to_celo_field_name: True}}
+                                       for record_id in record_ids])
 
 
 def handler(event: Dict[str, Any], context: Any) -> None:
@@ -488,19 +1064,20 @@ def handler(event: Dict[str, Any], context: Any) -> None:
     web3 = connect_to_blockchain(provider_url)
     
     base_id, access_token = fetch_airtable_credentials()
-    credits_table = Airtable(base_id, "Creditos", access_token) 
-    contacts_table = Airtable(base_id, "Contactos", access_token)
+    credits_table = get_airtable_table(base_id, "Creditos", access_token)
+    contacts_table = get_airtable_table(base_id, "Contactos", access_token)
 
-    credit_records = fetch_non_published_credits_from_airtable(credits_table, environment)
+    credit_pages = iter_non_published_credits_from_airtable(credits_table, environment)
 
-    all_success, number_published_records = publish_to_celo(web3, credit_contract_addr, credit_contract_abi, credit_records,
+    all_success, number_published_records = publish_to_celo(web3, credit_contract_addr, credit_contract_abi, credit_pages,
                                                             credits_table, contacts_table, mnemonic, environment)
 
     if all_success:
         logger.info("FINISHED SUCCESSFULLY: blockchain publisher task")
         return "FINISHED SUCCESSFULLY: blockchain publisher task"
     else:
-        raise Exception(f"Only {number_published_records} transaction were published of {len(credit_records)}.")
+        raise Exception(f"Only {number_published_records} transaction were published, the remaining credits are left "
+                        f"as unpublished.")
 
 
 if __name__ == "__main__":
@@ -30,12 +30,20 @@ import logging
 import os
 import re
 import time
-from typing import List, Tuple, Dict, Any
+from typing import List, Tuple, Dict, Any, Iterable, Iterator, Optional
 from airtable import Airtable
 from web3 import Web3, Account
-from python_utilities.utils import to_unix_timestamp, logger, setup_local_logger
+from python_utilities.utils import iso_to_unix_timestamp, logger, setup_local_logger
 from credit_blockchain_publisher import fetch_celo_credentials, fetch_contract_info, connect_to_blockchain, \
-                                         fetch_airtable_credentials, wait_for_transaction_receipt
+                                         fetch_airtable_credentials, send_raw_transactions, wait_for_transaction_receipts, \
+                                         get_airtable_table, check_gas_price, get_account, get_contract, \
+                                         call_contract_functions, GasPriceTooHighError, AIRTABLE_PAGE_SIZE
+
+
+RECORD_PAYMENT_GAS_LIMIT = 250000 # recordPayment has a fixed storage footprint, its measured cost plus a safety margin
+PAYMENT_PIPELINE_SIZE = 25 # Transactions sent before awaiting their receipts, bounds the pending ones in the mempool
+PAYMENT_RECORD_BATCH_SIZE = 20 # Payments recorded per recordPaymentBatch transaction, far below the block gas limit
+
 
 # Definiciones de las excepciones
 class PaymentTransactionError(Exception):
@@ -55,109 +63,193 @@ class RevertError(PaymentTransactionError):
         super().__init__(self.message)
 
 
-def get_outstanding_balance(contract, credit_id):
-    return contract.functions.outstandingBalance(credit_id).call()
+def read_payment_states(web3, contract, payments: List[Dict[str, Any]]) -> List[Tuple[bool, int]]:
+    """
+    Reads whether each payment is already recorded on the blockchain, and the outstanding balance of its credit.
+
+    The reads of all the payments are sent in a single JSON-RPC batch request, instead of two calls per payment.
+
+    Parameters:
+    - web3 (Web3): An instance of the Web3 class connected to the Celo blockchain.
+    - contract (Contract): The credits smart contract instance.
+    - payments (List[Dict[str, Any]]): The details of the payments, as returned by get_payment_details.
+
+    Returns:
+    - List[Tuple[bool, int]]: For each payment, in the same order, whether the contract maps the payment to a credit
+                              (which recordPayment does for every payment it records) and the outstanding balance
+                              of its credit.
+
+    Raises:
+    - ValueError: If the reads fail, as raised by call_contract_functions.
+    """
+    calls = []
+    for payment_details in payments:
+        calls.append(('paymentToCredit', (payment_details['id_payment'],)))
+        calls.append(('outstandingBalance', (payment_details['id_credit'],)))
+    results = call_contract_functions(web3, contract, calls)
+    return [(results[index] != 0, results[index + 1]) for index in range(0, len(results), 2)]
+
+def get_revert_error(payment_details, payment_recorded: bool, outstanding_balance: int) -> PaymentTransactionError:
+    """
+    Tells why a recordPayment transaction was reverted, from the contract state read after it was mined.
+
+    Parameters:
+    - payment_details (dict): A dictionary containing details of the payment, including id_payment, id_credit and amount.
+    - payment_recorded (bool): Whether the payment is recorded on the blockchain, as read by read_payment_states.
+    - outstanding_balance (int): The outstanding balance of the credit of the payment, as read by read_payment_states.
+
+    Returns:
+    - PaymentTransactionError: RevertError if the payment is already recorded, OverflowError if the payment amount is
+      above the outstanding balance of its credit, or a generic PaymentTransactionError otherwise.
+    """
+    if payment_recorded:
+        return RevertError()
+    if outstanding_balance < payment_details['amount']:
+        return OverflowError()
+    return PaymentTransactionError("Transaction reverted by the EVM.")
+
+
+def get_payment_details(payment: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Converts an Airtable payment record into the details of its recordPayment transaction.
+
+    Records with missing or malformed fields are rejected here, before any transaction is built, so they do not
+    interrupt the publication of the rest of the payments. Ids must not be zero, since the contract tells recorded
+    payments apart by their credit id being non-zero.
+
+    Parameters:
+    - payment (Dict[str, Any]): A payment record from a page yielded by iter_non_published_payments_from_airtable.
+
+    Returns:
+    - Dict[str, Any] or None: The payment_record_id, id_payment, id_credit, amount and payment_date of the payment,
+                              or None if the record is not valid.
+    """
+    payment_fields = payment['fields']
+    try:
+        payment_details = {
+            'payment_record_id': payment['id'],
+            'id_payment': int(payment_fields['ID Pagos']),
+            'id_credit': int(payment_fields['ID_credito_nocode']),
+            'amount': int(payment_fields['MONTO']),
+            'payment_date': iso_to_unix_timestamp(payment_fields['Fecha de pago'])
+        }
+    except (KeyError, TypeError, ValueError) as e:
+        logger.error(f"    -> Skipping payment record {payment['id']}, invalid field: {e!r}")
+        return None
+
+    if payment_details['id_payment'] <= 0 or payment_details['id_credit'] <= 0 or payment_details['amount'] < 0:
+        logger.error(f"    -> Skipping payment record {payment['id']}, invalid values: {payment_details}")
+        return None
+
+    return payment_details
+
+
+def iter_payment_windows(payment_pages: Iterable[List[Dict[str, Any]]], payment_queue: List[Dict[str, Any]],
+                         invalid_record_ids: List[str], window_size: int) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Yields the payments to publish in windows of up to window_size payments, as their pages are fetched.
+
+    Every page is validated as a whole when it arrives, so the windows only hold valid payment details.
+
+    Parameters:
+    - payment_pages (Iterable[List[Dict[str, Any]]]): The pages of payment records to publish.
+    - payment_queue (List[Dict[str, Any]]): The details of the payments waiting for a window. Payments appended to it
+                                            while a window is published, to be sent again, go into the next windows.
+    - invalid_record_ids (List[str]): Filled with the record ids of the payments rejected by get_payment_details.
+    - window_size (int): The maximum number of payments in a window.
+
+    Yields:
+    - List[Dict[str, Any]]: The details of the payments of each window, as returned by get_payment_details.
+    """
+    for payment_page in payment_pages:
+        for payment in payment_page:
+            payment_details = get_payment_details(payment)
+            if payment_details:
+                payment_queue.append(payment_details)
+            else:
+                invalid_record_ids.append(payment['id'])
+        while len(payment_queue) >= window_size:
+            window = payment_queue[:window_size]
+            del payment_queue[:window_size]
+            yield window
+
+    while payment_queue:
+        window = payment_queue[:window_size]
+        del payment_queue[:window_size]
+        yield window
+
 
-def send_transaction_and_update_airtable(web3, contract, account, nonce, payment_details, payments_table, env):
+def sign_payment_transaction(web3, contract, payment_batch, use_batch_recording, account_address, private_key, nonce,
+                             base_fee, priority_fee):
     """
-    Creates, signs, and sends a transaction to the Celo blockchain, and updates Airtable as needed.
+    Creates and signs a transaction for the Celo blockchain that records a batch of payments.
 
-    This function estimates the gas required for the transaction, builds the transaction with the specified parameters,
-    signs it with the provided account, and sends it to the Celo blockchain. It waits for the transaction to be confirmed
-    and updates the payment status in Airtable.
+    When the contract supports batch recording, the whole batch is recorded by a single recordPaymentBatch call, so
+    the base transaction cost, the signature and the nonce are shared by every payment in it. Otherwise the batch
+    holds a single payment, which is recorded through recordPayment. This function builds the transaction with a
+    fixed gas limit per payment and the EIP-1559 fees estimated once for its whole window, and signs it with the
+    provided account. It does not send it: the caller sends the transactions of a whole window in a single request,
+    and then awaits their receipts together.
 
     Parameters:
     - web3 (Web3): An instance of the Web3 class connected to the Celo blockchain.
     - contract (Contract): An instance of the smart contract to interact with.
-    - account (Account): The account derived from the mnemonic phrase for signing and sending transactions.
-    - nonce (int): The current nonce of the account for the transaction.
-    - payment_details (dict): A dictionary containing details of the payment, including id_payment, id_credit, amount, and payment_date.
-    - payments_table (Airtable): An instance of the Airtable class to access the payments table.
-    - env (str): The environment context ('staging' or 'production') affecting the publication process.
+    - payment_batch (List[dict]): The details of the payments to record, each one including id_payment, id_credit,
+                                  amount, and payment_date.
+    - use_batch_recording (bool): Whether the contract supports the recordPaymentBatch function.
+    - account_address (str): The address of the account, derived from the mnemonic phrase, sending the transaction.
+    - private_key (bytes): The private key used to sign the transaction.
+    - nonce (int): The nonce to use for the transaction.
+    - base_fee (int): The estimated base fee of the next block, in wei, as returned by check_gas_price.
+    - priority_fee (int): The priority fee to pay, in wei, as returned by check_gas_price.
 
     Returns:
-    - Tuple[bool, int]: A tuple where the first element is True if the transaction was successful, False otherwise,
-      and the second element is the updated nonce after sending the transaction.
+    - SignedTransaction: The signed transaction, ready to be sent.
 
     Raises:
-    - OverflowError: If the transaction causes an overflow error.
-    - RevertError: If the transaction is reverted by the EVM.
-    - PaymentTransactionError: For any other general errors during the transaction processing.
+    - PaymentTransactionError: If the transaction could not be built or signed.
     """
-    
-    id_payment = payment_details['id_payment']
-    id_credit = payment_details['id_credit']
-    amount = payment_details['amount']
-    payment_date = payment_details['payment_date']
-
-    # Logging the start of transaction process for a payment
-    logger.info(f"Starting transaction for payment: {payment_details}")
+    # Logging the start of transaction process for the payments
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Starting transaction for payments: %s", [payment_details['id_payment'] for payment_details in payment_batch])
     try:
-        # Estimating gas for the transaction and preparing transaction details
-        logger.debug(f"Estimating gas for the payment transaction ID: {id_payment}")
-
-        estimated_gas = contract.functions.recordPayment(
-            creditId=id_credit,
-            paymentId=id_payment,
-            paymentAmount=amount,
-            paymentDate=payment_date
-        ).estimate_gas({'from': account.address})
-
-        gas_price = web3.eth.gas_price
-
-        # Building the transaction
-        tx = contract.functions.recordPayment(
-            creditId=id_credit,
-            paymentId=id_payment,
-            paymentAmount=amount,
-            paymentDate=payment_date
-        ).build_transaction({
-            'from': account.address,
+        if use_batch_recording:
+            contract_call = contract.functions.recordPaymentBatch([
+                (payment_details['id_credit'], payment_details['id_payment'], payment_details['amount'],
+                 payment_details['payment_date'])
+                for payment_details in payment_batch
+            ])
+        else:
+            payment_details = payment_batch[0]
+            contract_call = contract.functions.recordPayment(
+                creditId=payment_details['id_credit'],
+                paymentId=payment_details['id_payment'],
+                paymentAmount=payment_details['amount'],
+                paymentDate=payment_details['payment_date']
+            )
+
+        # Building the transaction, with the fixed RECORD_PAYMENT_GAS_LIMIT instead of a per-payment gas estimation
+        tx = contract_call.build_transaction({
+            'from': account_address,
             'nonce': nonce,
-            'gas': estimated_gas + 100000,  # margen extra de gas
-            'gasPrice': gas_price
+            'gas': RECORD_PAYMENT_GAS_LIMIT * len(payment_batch),
+            # Twice the base fee keeps the transaction valid if the base fee rises in the next blocks
+            'maxFeePerGas': 2 * base_fee + priority_fee,
+            'maxPriorityFeePerGas': priority_fee
         })
 
-        # Signing the transaction
-        signed_tx = account.sign_transaction(tx)
-
-        # Sending the transaction
-        tx_hash = web3.eth.send_raw_transaction(signed_tx.rawTransaction)
-        logger.info(f"    -> Sent transaction for payment id {id_payment}, awaiting receipt...")
-
-        # Waiting for the transaction to be confirmed
-        tx_receipt = wait_for_transaction_receipt(web3, tx_hash)
-        logger.debug(f"Transaction receipt: {tx_receipt}")
-        if tx_receipt:
-            # Updating Airtable with the payment status
-            set_payment_as_published(payments_table, payment_details['payment_record_id'], env)
-            logger.info(f"    -> Transaction successfully sent: payment id {id_payment}, hash {tx_hash.hex()}")
-            return True , nonce + 1
-        else:
-            logger.error(f"    -> Failed to get receipt for payment id {id_payment}.")
-            return False, nonce
+        # Signing the transaction directly with the private key extracted once by the caller
+        return Account.sign_transaction(tx, private_key)
 
     except Exception as e:
-        error_message = str(e)
-        # Checking for specific error messages and raising custom exceptions accordingly
-        if "Panic error 0x11" in error_message:
-            # Lanza una OverflowError personalizada si se detecta un error de overflow.
-            raise OverflowError("Panic error 0x11: Arithmetic operation results in underflow or overflow.") from e
-        elif "revert" in error_message.lower():
-            # Suponiendo que puedas detectar errores de revert por el mensaje, lanza RevertError.
-            raise RevertError("Transaction reverted by the EVM.") from e
-        else:
-            # Para cualquier otro tipo de error, lanza una PaymentTransactionError genérica.
-            raise PaymentTransactionError("Failed to process payment.") from e
-
-
+        raise PaymentTransactionError("Failed to process payment.") from e
 
 
 def publish_to_celo(
     web3: Web3, 
     contract_address: str, 
     abi: List[Dict[str, Any]], 
-    payment_records: List[Dict[str, Any]], 
+    payment_pages: Iterable[List[Dict[str, Any]]], 
     payments_table: Airtable, 
     mnemonic: str, 
     env: str
@@ -165,16 +257,29 @@ def publish_to_celo(
     """
     Publishes payment records to the Celo blockchain by creating transactions for each payment.
 
-    This function iterates through a list of payment records, constructs and signs transactions using the provided
+    This function iterates through pages of payment records, constructs and signs transactions using the provided
     mnemonic, and publishes each transaction to the Celo blockchain. It handles the derivation of Celo addresses,
     calculates necessary transaction parameters (e.g., gas), and ensures transactions are successfully mined.
     Additionally, it updates the publication status in Airtable to prevent re-publishing of already processed payments.
 
+    When the contract ABI includes recordPaymentBatch, payments are grouped in batches of up to
+    PAYMENT_RECORD_BATCH_SIZE and each batch is recorded by a single transaction; otherwise every payment is recorded
+    by its own transaction.
+
+    Payments are published in windows of up to PAYMENT_PIPELINE_SIZE transactions, each one in two phases: first every
+    transaction of the window is signed with a locally incremented nonce, and the whole window is sent in a single
+    JSON-RPC batch request, without waiting for the transactions to be mined; then the receipts are awaited together.
+    Payments already recorded on the blockchain, as read for the whole window by read_payment_states, are marked as
+    published without sending them again, and a payment id repeated in Airtable is only sent once per run. The nonce is read again from
+    the blockchain before the next window, so transactions that were not mined do not leave a gap.
+
     Parameters:
     - web3 (Web3): An instance of the Web3 class, connected to the Celo blockchain.
     - contract_address (str): The address of the smart contract on the Celo blockchain to interact with.
     - abi (List[Dict[str, Any]]): The ABI (Application Binary Interface) of the contract, defining how to interact with it.
-    - payment_records (List[Dict[str, Any]]): A list of dictionaries, each representing a payment record to be published.
+    - payment_pages (Iterable[List[Dict[str, Any]]]): An iterable of pages of payment records to be published, each
+                                                      record being a dictionary. It can be a generator, so payments
+                                                      are sent while the next Airtable page is still pending.
     - payments_table (Airtable): An instance of the Airtable class for accessing the payments table.
     - mnemonic (str): The mnemonic phrase used to derive blockchain addresses and sign transactions.
     - env (str): The environment context ('staging' or 'production') which affects the publication process,
@@ -185,95 +290,209 @@ def publish_to_celo(
         - all_success (bool): True if all transactions were published successfully.
         - count_published_routes (int): Number of payments published.
 
-    Raises:
-    - OverflowError: Occurs when the payment amount exceeds the recipient's outstanding balance. The function handles this error by adjusting the payment amount to the outstanding balance and attempting to republish the transaction. If adjustment and republishing are successful, the payment record is updated accordingly in the Airtable database; otherwise, the function logs the failure and sets `all_success` to False.
-
-    - RevertError: Indicates a transaction has been reverted by the EVM, possibly due to business logic in the smart contract (e.g., payment conditions not met). The function logs the specific reason for the revert and skips the current transaction.
-
-    - PaymentTransactionError: Custom exception indicating issues with transaction submission, such as gas estimation failures or network congestion. The function logs the error details and does not update the payment record in Airtable, allowing for retry.
-
     Notes:
+    - Payments above the outstanding balance of their credit are adjusted to it before being sent, taking into
+      account the earlier payments of the same window.
+    - The payments of a reverted transaction are classified with get_revert_error once it is mined:
+        - OverflowError: the payment amount exceeds the outstanding balance of its credit. The payment amount is
+          adjusted to the outstanding balance and the payment is sent again in a later window. If the adjusted payment
+          fails too, the function logs the failure and sets `all_success` to False. The rest of the payments of its
+          batch, reverted with it, are sent again as well.
+        - RevertError: the payment was already recorded by a previous run, so it is marked as published.
+        - PaymentTransactionError: any other revert. The function logs the error and does not update the payment
+          record in Airtable, allowing for retry.
+    - The fees of every transaction of a window are estimated once with check_gas_price. If the network gas price
+      is above MAX_GAS_PRICE, no more transactions are sent in the run and the remaining payments are left for the
+      next one.
+    - If the state of the payments cannot be read from the blockchain, no more transactions are sent in the run. The
+      payments already confirmed in the window are still marked as published in Airtable.
+    - If a transaction cannot be signed, the rest of its window is not sent either and is left for the next run. If
+      the node rejects a transaction, no more transactions are sent in the run, since their nonces would follow a gap.
+      Likewise, if the receipt of a transaction cannot be fetched, no more windows are sent in the run; its payments
+      are left unpublished, and the next run finds them recorded if they were mined.
     - Utilizes 'PublishedToCeloStaging' or 'PublishedToCeloProduction' fields in Airtable to track publication status and ensure idempotency.
     - Requires enabling unaudited HD wallet features in Web3.py for mnemonic-based account derivation.
     """
-    logger.info(f"About to publish {len(payment_records)} transactions...")
-    contract = web3.eth.contract(address=contract_address, abi=abi)
-
-
-    # Enable unaudited HD wallet features in order to allow using the mnemonic features
-    Account.enable_unaudited_hdwallet_features()
+    logger.info("About to publish transactions...")
+    contract = get_contract(web3, contract_address, abi)
+    use_batch_recording = any(item.get('name') == 'recordPaymentBatch' for item in abi)
+    batch_size = PAYMENT_RECORD_BATCH_SIZE if use_batch_recording else 1
 
     # Derive the account from the mnemonic
-    account = Account.from_mnemonic(mnemonic)
-    nonce = web3.eth.get_transaction_count(account.address)
+    account = get_account(mnemonic)
+    account_address = account.address
+    private_key = account.key
 
     all_success = True
     count_published_routes = 0
-    
-    # Iterate over the data and publish each row to Celo
-    for payment in payment_records:
-
-        payment_record_id = payment['id']
-        payment_fields = payment['fields']
-        id_payment = int(payment_fields['ID Pagos'])
-        id_credit = int(payment_fields['ID_credito_nocode'])
-        payment_date = to_unix_timestamp(payment_fields['Fecha de pago'], '%Y-%m-%d')
-        amount = int(payment_fields['MONTO'])
-        is_published_to_celo = payment_fields.get(f'PublishedToCelo{env.capitalize()}', False)
-
-        if is_published_to_celo:
-            logger.info(f"    -> Payment id {id_payment} is already published. Skipping re-publishing.")
-            continue
-
-        payment_details = {
-            'payment_record_id': payment_record_id,
-            'id_payment': id_payment,
-            'id_credit': id_credit,
-            'amount': amount,
-            'payment_date': payment_date
-        }
+    payment_queue = []
+    invalid_record_ids = []
+    adjusted_payment_ids = set()
+    sent_payment_ids = set()
+    stop_publishing = False
+
+    for window in iter_payment_windows(payment_pages, payment_queue, invalid_record_ids,
+                                       PAYMENT_PIPELINE_SIZE * batch_size):
+        nonce = web3.eth.get_transaction_count(account_address, 'pending')
+        window_payments = []
+        payments_to_send = []
+        signed_transactions = []
+        pending_transactions = []
+        published_record_ids = []
+
+        # Phase 1: sign every transaction of the window, incrementing the nonce locally, and send them all at once
+        for payment_details in window:
+            id_payment = payment_details['id_payment']
+            if id_payment in sent_payment_ids:
+                # Left unpublished, the next run finds it recorded and marks it as published
+                logger.warning(f"    -> Payment id {id_payment} is repeated in Airtable, it is only sent once.")
+                continue
+            window_payments.append(payment_details)
+            sent_payment_ids.add(id_payment)
 
+        # Payments recorded by a previous run whose Airtable update failed are marked without sending them again
         try:
-            logger.info(f"web3: {web3}, contract: {contract}, account: {account}, nonce: {nonce}, payment_details: {payment_details}, payments_table: {payments_table}, env: {env}")
-            success, nonce = send_transaction_and_update_airtable(web3, contract, account, nonce, payment_details, payments_table, env)
-            if success:
-                count_published_routes += 1
-            else:
+            payment_states = read_payment_states(web3, contract, window_payments)
+        except ValueError as e:
+            # Nothing of the window is sent, its payments are left for the next run
+            logger.error(f"    -> Error reading the state of {len(window_payments)} payments: {e}. "
+                         f"Leaving the remaining payments for the next run.")
+            all_success = False
+            stop_publishing = True
+            payment_states = []
+        remaining_balances = dict()
+        for payment_details, (payment_recorded, outstanding_balance) in zip(window_payments, payment_states):
+            id_payment = payment_details['id_payment']
+            id_credit = payment_details['id_credit']
+            if payment_recorded:
+                logger.info("    -> Payment %s is already published. Continuing with next transaction.", id_payment)
+                published_record_ids.append(payment_details['payment_record_id'])
+                continue
+
+            # Payments above the outstanding balance of their credit, after the earlier payments of the window, are
+            # adjusted before sending them, instead of letting their transaction revert
+            remaining_balance = remaining_balances.get(id_credit, outstanding_balance)
+            if payment_details['amount'] > remaining_balance:
+                logger.info("    -> Payment %s exceeds the outstanding balance of credit %s. Adjusting payment to outstanding balance.",
+                            id_payment, id_credit)
+                logger.debug("    -> Payment amount %s adjusted to the outstanding balance %s of credit %s",
+                             payment_details['amount'], remaining_balance, id_credit)
+                adjusted_payment_ids.add(id_payment)
+                payment_details = dict(payment_details, amount=remaining_balance)
+            remaining_balances[id_credit] = remaining_balance - payment_details['amount']
+            payments_to_send.append(payment_details)
+
+        # The fees are estimated once for the whole window, and refused while the network gas price is spiking
+        if payments_to_send:
+            try:
+                base_fee, priority_fee = check_gas_price(web3)
+            except GasPriceTooHighError as e:
+                # Not an error of the payments themselves: they are left unpublished, to be sent on a later run
+                logger.warning(f"    -> {e}. Deferring the remaining payments to the next run.")
                 all_success = False
-        except OverflowError as oe:
+                stop_publishing = True
+                payments_to_send = []
 
-            logger.info(f"    -> Overflow error recording payment {id_payment} for credit {id_credit}. Adjusting payment to outstanding balance.")
-            print(f"amount to pay before get_oustandingbalance is: {amount}")
-            outstanding_balance = get_outstanding_balance(contract, id_credit)
-            print(f"Outstanding-balance for credit {id_credit} is: {outstanding_balance}")
-            payment_details['amount'] = outstanding_balance
+        for start in range(0, len(payments_to_send), batch_size):
+            payment_batch = payments_to_send[start:start + batch_size]
             try:
-                success, nonce = send_transaction_and_update_airtable(web3, contract, account, nonce, payment_details, payments_table, env)
-                if success:
-                    logger.info(f"    -> Successfully adjusted and published payment id {id_payment}.")
-                    count_published_routes += 1
-                else:
-                    logger.error(f"    -> Failed to adjust and publish payment id {id_payment}.")
-                    all_success = False
-            except Exception as ex:
-                logger.error(f"    -> Error adjusting payment id {id_payment}: {ex}")
+                signed_tx = sign_payment_transaction(web3, contract, payment_batch, use_batch_recording,
+                                                     account_address, private_key, nonce, base_fee, priority_fee)
+            except PaymentTransactionError as e:
+                logger.error(f"    -> Error publishing payment id {payment_batch[0]['id_payment']}: {e.__cause__}. "
+                             f"Leaving the rest of the window for the next run.")
                 all_success = False
-        except RevertError as re:
-                logger.info(f"    -> Payment {id_payment} is already published. Continuing with next transaction.")
-                set_payment_as_published(payments_table, payment_record_id, env)
-                count_published_routes += 1
+                break
+            signed_transactions.append((payment_batch, signed_tx))
+            nonce += 1
+
+        tx_hashes = send_raw_transactions(web3, [signed_tx.rawTransaction for _, signed_tx in signed_transactions])
+        for (payment_batch, _), tx_hash in zip(signed_transactions, tx_hashes):
+            if tx_hash is None:
+                # Later nonces cannot be mined before this one, so no more transactions are sent in this run
+                logger.error(f"    -> Failed to send payment id {payment_batch[0]['id_payment']}. "
+                             f"Leaving the remaining payments for the next run.")
+                all_success = False
+                stop_publishing = True
+                break
+            logger.info("    -> Sent transaction for %s payments, hash %s", len(payment_batch), tx_hash.hex())
+            pending_transactions.append((payment_batch, tx_hash))
+
+        # Phase 2: wait for the receipts of the whole window at once
+        tx_receipts = wait_for_transaction_receipts(web3, [tx_hash for _, tx_hash in pending_transactions])
+
+        for (payment_batch, tx_hash), tx_receipt in zip(pending_transactions, tx_receipts):
+            if not tx_receipt:
+                logger.error(f"    -> Failed to get receipt for tx hash {tx_hash.hex()}, "
+                             f"payment ids {[payment_details['id_payment'] for payment_details in payment_batch]}.")
+                all_success = False
+                # The node is stuck or unavailable, later windows would only wait for their receipts until timing out
+                stop_publishing = True
                 continue
-        except PaymentTransactionError as e:
-            logger.error(f"    -> Error publishing payment id {id_payment}: {e}. See above for more details.")
-            all_success = False
 
+            if tx_receipt['status'] == 0:
+                # Without a gas estimation up front, a revert is only detected once the transaction is mined
+                try:
+                    payment_states = read_payment_states(web3, contract, payment_batch)
+                except ValueError as e:
+                    # The rest of the window is still processed, so its confirmed payments are marked as published
+                    logger.error(f"    -> Error reading the state of the payments of reverted tx hash {tx_hash.hex()}, "
+                                 f"payment ids {[payment_details['id_payment'] for payment_details in payment_batch]}: "
+                                 f"{e}. Leaving them for the next run.")
+                    all_success = False
+                    stop_publishing = True
+                    continue
+                revert_errors = [get_revert_error(payment_details, *payment_state)
+                                 for payment_details, payment_state in zip(payment_batch, payment_states)]
+                batch_adjusted = any(isinstance(error, OverflowError) and payment_details['id_payment'] not in adjusted_payment_ids
+                                     for payment_details, error in zip(payment_batch, revert_errors))
+                for payment_details, error, (_, outstanding_balance) in zip(payment_batch, revert_errors, payment_states):
+                    id_payment = payment_details['id_payment']
+                    id_credit = payment_details['id_credit']
+                    if isinstance(error, RevertError):
+                        logger.info("    -> Payment %s is already published. Continuing with next transaction.", id_payment)
+                        published_record_ids.append(payment_details['payment_record_id'])
+                    elif isinstance(error, OverflowError) and id_payment not in adjusted_payment_ids:
+                        logger.info("    -> Overflow error recording payment %s for credit %s. Adjusting payment to outstanding balance.",
+                                    id_payment, id_credit)
+                        logger.debug("    -> Payment amount %s adjusted to the outstanding balance %s of credit %s",
+                                     payment_details['amount'], outstanding_balance, id_credit)
+                        adjusted_payment_ids.add(id_payment)
+                        sent_payment_ids.discard(id_payment)
+                        payment_queue.append(dict(payment_details, amount=outstanding_balance))
+                    elif batch_adjusted and not isinstance(error, OverflowError):
+                        # Only reverted together with the adjusted payments of its batch, so it is sent again
+                        sent_payment_ids.discard(id_payment)
+                        payment_queue.append(payment_details)
+                    else:
+                        logger.error(f"    -> Error publishing payment id {id_payment}: {error}")
+                        all_success = False
+                continue
+
+            for payment_details in payment_batch:
+                id_payment = payment_details['id_payment']
+                if id_payment in adjusted_payment_ids:
+                    logger.info("    -> Successfully adjusted and published payment id %s.", id_payment)
+                logger.info("    -> Transaction successfully sent: payment id %s, hash %s", id_payment, tx_hash.hex())
+                published_record_ids.append(payment_details['payment_record_id'])
+
+        if published_record_ids:
+            set_payments_as_published(payments_table, published_record_ids, env)
+            count_published_routes += len(published_record_ids)
+
+        if stop_publishing:
+            break
+
+    if invalid_record_ids:
+        logger.error(f"    -> {len(invalid_record_ids)} payment records were skipped for invalid fields: {invalid_record_ids}")
+        all_success = False
 
     return all_success, count_published_routes
 
 
-def fetch_non_published_payments_from_airtable(payments_table: Airtable, env: str):
+def iter_non_published_payments_from_airtable(payments_table: Airtable, env: str) -> Iterator[List[Dict[str, Any]]]:
     """
-    Retrieves a list of payment records from Airtable that have not yet been published to the Celo blockchain.
+    Yields pages of the payment records from Airtable that have not yet been published to the Celo blockchain.
 
     This function queries the Airtable payments table to find all records that are marked as not published
     according to the 'PublishedToCeloStaging' or 'PublishedToCeloProduction' column, depending on the
@@ -285,43 +504,58 @@ def fetch_non_published_payments_from_airtable(payments_table: Airtable, env: st
     - env (str): The environment context ('staging' or 'production') which influences the filter criteria
                  for fetching non-published payments.
 
-    Returns:
-    list[dict]: A list of payment records that have not been marked as published in the specified environment.
-                Each record is represented as a dictionary.
+    Yields:
+    list[dict]: Each page of payment records that have not been marked as published in the specified environment.
+                Only one Airtable page is held in memory, and the first payments can be published before the
+                following pages are requested.
+
+    Note:
+    The published fields of the payment and of its credit are only used by the server-side formula; they are not
+    transferred since their values are fixed by the formula in every returned record.
     """
     logger.info("Fetching pagos from airtable (view PAYMENT_TO_CELO_PIPELINE_VIEW)...")
     payment_published_to_celo_field_name = f'PublishedToCelo{env.capitalize()}'
     credit_published_to_celo_field_name = f'CreditPublishedToCelo{env.capitalize()}'
-
-    payment_records = payments_table.get_all(
+    count_payments = 0
+    for page in payments_table.get_iter(
         view='PAYMENT_TO_CELO_PIPELINE_VIEW', 
-        fields=['ID Pagos', 'Fecha de pago', 'MONTO', 'ID_credito_nocode',
-                payment_published_to_celo_field_name, credit_published_to_celo_field_name],
-        formula=f'AND(NOT({{{payment_published_to_celo_field_name}}}), {{{credit_published_to_celo_field_name}}})'
-        )
-    logger.info(f"    --> Fetched {len(payment_records)} payments.")
-    return payment_records
+        fields=['ID Pagos', 'Fecha de pago', 'MONTO', 'ID_credito_nocode'],
+        formula=f'AND(NOT({{{payment_published_to_celo_field_name}}}), {{{credit_published_to_celo_field_name}}})',
+        page_size=AIRTABLE_PAGE_SIZE
+        ):
+        count_payments += len(page)
+        logger.info(f"    --> Fetched a page of {len(page)} payments ({count_payments} so far).")
+        yield page
 
 
-def set_payment_as_published(payments_table: Airtable, record_id: str, env: str):
+def set_payments_as_published(payments_table: Airtable, record_ids: List[str], env: str):
     """
-    Marks a payment record in Airtable as published to the Celo blockchain by updating the appropriate column
+    Marks payment records in Airtable as published to the Celo blockchain by updating the appropriate column
     based on the execution environment.
 
-    This function targets a specific record, identified by its record ID, and updates its status to indicate
-    that it has been successfully published. This is achieved by setting the 'PublishedToCeloStaging' or
+    This function targets the given records, identified by their record IDs, and updates their status to indicate
+    that they have been successfully published. This is achieved by setting the 'PublishedToCeloStaging' or
     'PublishedToCeloProduction' column to True, depending on whether the function is operating in a staging
-    or production environment.
+    or production environment. Records are updated in batches of 10, the maximum Airtable accepts per request;
+    if a batch update fails, the records are updated one by one, so a single failing record does not leave the
+    rest of them as unpublished.
 
     Parameters:
     - payments_table (Airtable): An instance of the Airtable class, configured to interact with the payments table.
-    - record_id (str): The unique identifier of the payment record to update in the Airtable.
+    - record_ids (List[str]): The unique identifiers of the payment records to update in the Airtable.
     - env (str): The environment context ('staging' or 'production') that dictates which column to update.
 
     Returns:
-    dict: The response from the Airtable API after updating the record, which includes the updated fields.
+    list: The responses from the Airtable API after updating the records, which include the updated fields.
     """
-    return payments_table.update(record_id, {f'PublishedToCelo{env.capitalize()}': True})
+    published_to_celo_field_name = f'PublishedToCelo{env.capitalize()}'
+    records = [{'id': record_id, 'fields': {published_to_celo_field_name: True}} for record_id in record_ids]
+    try:
+        return payments_table.batch_update(records)
+    except Exception as e:
+        logger.warning(f"    -> Failed to mark {len(records)} payments as published in a batch ({e}), "
+                       f"updating them one by one.")
+        return [payments_table.update(record['id'], record['fields']) for record in records]
 
 
 def handler(event: Dict[str, Any], context: Any) -> None:
@@ -368,18 +602,19 @@ def handler(event: Dict[str, Any], context: Any) -> None:
     web3 = connect_to_blockchain(provider_url)
     
     base_id, access_token = fetch_airtable_credentials()
-    payments_table = Airtable(base_id, "Pagos", access_token) 
+    payments_table = get_airtable_table(base_id, "Pagos", access_token)
 
-    payment_records = fetch_non_published_payments_from_airtable(payments_table, environment)
+    payment_pages = iter_non_published_payments_from_airtable(payments_table, environment)
 
-    all_success, number_published_records = publish_to_celo(web3, payment_contract_addr, payment_contract_abi, payment_records,
+    all_success, number_published_records = publish_to_celo(web3, payment_contract_addr, payment_contract_abi, payment_pages,
                                                             payments_table, mnemonic, environment)
 
     if all_success:
         logger.info("FINISHED SUCCESSFULLY: blockchain publisher task")
         return "FINISHED SUCCESSFULLY: blockchain publisher task"
     else:
-        raise Exception(f"Only {number_published_records} transaction were published of {len(payment_records)}.")
+        raise Exception(f"Only {number_published_records} transaction were published, the remaining payments are left "
+                        f"as unpublished.")
 
 
 if __name__ == "__main__":
@@ -19,6 +19,7 @@ Command-Line Arguments:
 - `--date` (`-d`): Specifies the date for data retrieval and processing. Defaults to yesterday's date if not provided.
 - `--environment` (`-e`): Determines the execution environment ('staging' or 'production'). Required.
 - `--timeout` (`-t`): Sets the maximum execution time in seconds, ensuring the script concludes gracefully before reaching this limit. Optional, with a default of 900 seconds.
+- `--poll-interval` (`-p`): Sets the time in seconds before the second receipt poll of each transaction. Optional, with a default of 0.5 seconds.
 
 Execution Examples:
 - CLI: `python lambda_blockchain_publish.py --date 2023-12-01 --environment staging`
@@ -44,14 +45,38 @@ import argparse
 import logging
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from typing import Dict, Any
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from web3 import Web3, HTTPProvider, Account
+from eth_account.signers.local import LocalAccount
 from web3.middleware import geth_poa_middleware
+from web3.exceptions import ContractLogicError, TransactionNotFound
 from botocore.exceptions import ClientError
 from python_utilities.utils import validate_date, read_csv_from_s3, read_yaml_from_s3, read_json_from_s3, format_dashed_date, yesterday, logger, \
-    				setup_local_logger, list_s3_files, dict_to_json_s3, RODAAPP_BUCKET_PREFIX
+    				setup_local_logger, list_s3_files, dict_to_json_s3, get_derived_from_secret, RODAAPP_BUCKET_PREFIX
 
 
+# Enable unaudited HD wallet features in order to allow using the mnemonic features
+Account.enable_unaudited_hdwallet_features()
+
+CELO_BLOCK_TIME = 5 # Seconds between blocks, receipts are never polled less often than this
+RPC_REQUEST_TIMEOUT = 30 # Seconds
+RECORD_ROUTE_GAS_LIMIT = 250000 # recordRoute has a fixed storage footprint, its measured cost plus a safety margin
+ROUTE_RECORD_BATCH_SIZE = 20 # Routes recorded per recordRouteBatch transaction, far below the block gas limit
+CSV_READ_WORKERS = 8 # Input CSV files read from S3 at the same time
+RECEIPT_POLL_INTERVAL = 0.5 # Seconds before the second receipt poll, later polls back off up to CELO_BLOCK_TIME
+ROUTE_PIPELINE_SIZE = 25 # Transactions sent before awaiting their receipts, bounds the pending ones in the mempool
+
+# Web3 connections kept across warm Lambda invocations, keyed by provider URL
+WEB3_CONNECTIONS: Dict[str, Web3] = {}
+
+# Accounts derived from their mnemonic, kept across warm Lambda invocations, keyed by the mnemonic's SHA-256 digest
+ACCOUNTS: Dict[bytes, LocalAccount] = {}
+
 def fetch_celo_credentials(environment: str):
     """
     Fetches the Celo network credentials from S3 based on the specified environment.
@@ -120,62 +145,139 @@ def connect_to_blockchain(provider_url: str):
     Utilizes the provided URL to connect to the blockchain via Web3. This connection is essential for
     interacting with the blockchain, including publishing transactions.
 
+    The provider uses a pooled keep-alive session, so every RPC call shares the same TLS connection instead of
+    paying a new handshake. Only connection errors are retried: the request never reached the node in that case,
+    so retrying is safe even for eth_sendRawTransaction. The connection is kept at module level, so warm AWS
+    Lambda invocations reuse it together with the open connections of its session.
+
     Parameters:
     - provider_url (str): The URL of the blockchain provider to connect to.
 
     Returns:
     - Web3: An instance of Web3 connected to the specified blockchain network.
     """
-    web3 = Web3(HTTPProvider(provider_url))
-    web3.middleware_onion.inject(geth_poa_middleware, layer=0)
-    return web3
-
-
-def wait_for_transaction_receipt(web3, tx_hash, poll_interval=10, timeout=300, max_attempts=5):
+    if provider_url not in WEB3_CONNECTIONS:
+        session = requests.Session()
+        session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=4,
+                                              max_retries=Retry(total=3, connect=3, read=0, status=0, backoff_factor=0.3)))
+        web3 = Web3(HTTPProvider(provider_url, session=session, request_kwargs={'timeout': RPC_REQUEST_TIMEOUT}))
+        web3.middleware_onion.inject(geth_poa_middleware, layer=0)
+        WEB3_CONNECTIONS[provider_url] = web3
+    return WEB3_CONNECTIONS[provider_url]
+
+
+def wait_for_transaction_receipt(web3, tx_hash, initial_poll_interval=RECEIPT_POLL_INTERVAL, max_poll_interval=CELO_BLOCK_TIME,
+                                 timeout=300):
     """
     Waits for a blockchain transaction to be mined and retrieves the transaction receipt.
 
     Periodically polls the blockchain for the transaction receipt until it is found or until a timeout is reached.
-    This ensures that a transaction has been successfully processed before proceeding.
+    This ensures that a transaction has been successfully processed before proceeding. Polls start right away and
+    back off geometrically up to the block time, so a transaction mined in the next block is picked up shortly
+    after it. The node answers "not found" until the transaction is mined, so that answer only means polling again.
 
     Parameters:
     - web3 (Web3): The Web3 instance connected to the blockchain.
     - tx_hash (HexBytes): The hash of the transaction to monitor.
-    - poll_interval (int, optional): Time in seconds between each poll. Defaults to 10.
+    - initial_poll_interval (float, optional): Time in seconds before the second poll. Defaults to RECEIPT_POLL_INTERVAL.
+    - max_poll_interval (float, optional): Maximum time in seconds between polls. Defaults to CELO_BLOCK_TIME.
     - timeout (int, optional): Maximum time in seconds to wait for the transaction receipt. Defaults to 300.
-    - max_attempts (int, optional): Maximum number of attempts to fetch the transaction receipt. Defaults to 5.
 
     Returns:
-    - dict or None: The transaction receipt if successful, None if timed out or after max attempts without success.
+    - dict or None: The transaction receipt if successful, None if timed out or if fetching the receipt failed.
     """
     logger.info(f"    -> Waiting for transaction to be mined (tx hash: {tx_hash.hex()})")
     start_time = time.time()
-    attempts = 0
+    poll_interval = initial_poll_interval
 
     while True:
         try:
-            logger.info("        -> still wating for transaction to be mined")
+            # Logged once per poll, so it is kept at DEBUG level to avoid flooding the logs
+            logger.debug("        -> still waiting for transaction to be mined")
             tx_receipt = web3.eth.get_transaction_receipt(tx_hash)
             if tx_receipt:
                 return tx_receipt
+        except TransactionNotFound:
+            # Not mined yet
+            pass
         except Exception as e:
-            error_message = str(e)
-            if "not found" in error_message and attempts < max_attempts:
-                logger.warning(f"    -> Transaction {tx_hash.hex()} not found. Retrying...")
-                attempts += 1
-            else:
-                # Handle other errors or give up after max_attempts
-                logger.error(f"    -> Error fetching receipt for tx hash: {tx_hash.hex()}: {e}")
-                return None
+            # Handle other errors
+            logger.error(f"    -> Error fetching receipt for tx hash: {tx_hash.hex()}: {e}")
+            return None
 
         if time.time() - start_time > timeout:
             logger.error(f"    -> Transaction receipt timeout for tx hash: {tx_hash.hex()}")
             return None
 
         time.sleep(poll_interval)
+        poll_interval = min(poll_interval * 1.5, max_poll_interval)
+
+
+def is_route_minted(contract, route_id: int) -> bool:
+    """
+    Checks whether the route token has already been minted on the blockchain.
+
+    Parameters:
+    - contract (Contract): The routes smart contract instance.
+    - route_id (int): The route id, which is also the ERC721 token id.
+
+    Returns:
+    - bool: True if the token has an owner, False if the contract reports it as nonexistent.
+    """
+    try:
+        contract.functions.ownerOf(route_id).call()
+        return True
+    except ContractLogicError:
+        return False
+
+
+def send_route_transaction(web3, contract, route_batch, use_batch_recording, account, nonce, gas_price):
+    """
+    Builds, signs and sends the transaction that records a batch of routes on the Celo blockchain.
+
+    When the contract supports batch recording, the whole batch is recorded by a single recordRouteBatch call, so
+    the base transaction cost, the signature and the nonce are shared by every route in it. Otherwise the batch holds
+    a single route, which is recorded through recordRoute. The transaction is built with a fixed gas limit per route
+    and the gas price read once by the caller, so building it takes no round-trip to the blockchain node.
 
+    Parameters:
+    - web3 (Web3): Web3 instance for blockchain interactions.
+    - contract (Contract): The routes contract instance.
+    - route_batch (list): The routes to record, each one as a tuple of its route id and the arguments expected by
+                          the contract (to, routeId, timestampStart, timestampEnd, distance).
+    - use_batch_recording (bool): Whether the contract supports the recordRouteBatch function.
+    - account (LocalAccount): The account sending and signing the transaction.
+    - nonce (int): The nonce of the transaction.
+    - gas_price (int): The gas price of the transaction, in wei.
 
-def publish_to_celo(web3, contract_address, abi, all_routes, published_routes, mnemonic, timeout):
+    Returns:
+    - HexBytes: The hash of the sent transaction.
+    """
+    if use_batch_recording:
+        contract_call = contract.functions.recordRouteBatch([route_args for _, route_args in route_batch])
+    else:
+        _, route_args = route_batch[0]
+        contract_call = contract.functions.recordRoute(*route_args)
+
+    # Building the transaction, with the fixed RECORD_ROUTE_GAS_LIMIT instead of a per-route gas estimation
+    tx = contract_call.build_transaction({
+        'from': account.address,
+        'nonce': nonce,
+        'gas': RECORD_ROUTE_GAS_LIMIT * len(route_batch),
+        'gasPrice': gas_price
+    })
+
+    # Sign the transaction
+    signed_tx = account.sign_transaction(tx)
+    logger.info(f"Publishing route ids {[route_id for route_id, _ in route_batch]}, with: nonce = {nonce}, "
+                f"gas_price = {gas_price}, and tx_hash = {signed_tx.hash.hex()}")
+
+    # Send the transaction
+    return web3.eth.send_raw_transaction(signed_tx.rawTransaction)
+
+
+def publish_to_celo(web3, contract_address, abi, all_routes, published_routes, mnemonic, timeout,
+                    poll_interval=RECEIPT_POLL_INTERVAL):
     """
     Publishes route data to the Celo blockchain and return progress.
 
@@ -183,6 +285,20 @@ def publish_to_celo(web3, contract_address, abi, all_routes, published_routes, m
     re-publishing. Monitors execution time to stop before the specified timeout, ensuring there's enough
     time to save the current progress to S3.
 
+    When the contract ABI includes recordRouteBatch, routes are grouped in batches of up to ROUTE_RECORD_BATCH_SIZE
+    and each batch is recorded by a single transaction; otherwise every route is recorded by its own transaction.
+
+    Transactions are published in windows of up to ROUTE_PIPELINE_SIZE, each one in two phases: first every
+    transaction of the window is signed with a locally incremented nonce and sent right away, without waiting for
+    the previous ones to be mined; then their receipts are awaited. The transactions of a window are mined together,
+    so the wait takes about as long as for a single one. The nonce is read again from the blockchain before the next
+    window, so transactions that were not mined do not leave a gap. The gas price is also read once per window and
+    shared by all of its transactions.
+
+    Without a gas estimation up front, a route already minted is only detected once its transaction reverts: when
+    routes are recorded one by one, a reverted route that turns out to be minted is recorded as such and publishing
+    goes on. A batch skips the routes already minted, so its revert is an error.
+
     Parameters:
     - web3 (Web3): Web3 instance for blockchain interactions.
     - contract_address (str): The blockchain contract address.
@@ -191,6 +307,8 @@ def publish_to_celo(web3, contract_address, abi, all_routes, published_routes, m
     - published_routes (dict): Record of routes already published to prevent duplicates.
     - mnemonic (str): The mnemonic for accessing the blockchain wallet.
     - timeout (int): Maximum allowed time (in seconds) for the function execution to ensure progress saving.
+    - poll_interval (float, optional): Time in seconds before the second receipt poll of a transaction.
+                                       Defaults to RECEIPT_POLL_INTERVAL.
 
     Returns:
     - tuple: Contains a boolean indicating overall success and a dictionary of the updated published routes.
@@ -198,111 +316,111 @@ def publish_to_celo(web3, contract_address, abi, all_routes, published_routes, m
     logger.info(f"About to publish {len(all_routes)} transactions...")
     start_time = time.time()
     contract = web3.eth.contract(address=contract_address, abi=abi)
+    use_batch_recording = any(item.get('name') == 'recordRouteBatch' for item in abi)
+    batch_size = ROUTE_RECORD_BATCH_SIZE if use_batch_recording else 1
 
-
-    # Enable unaudited HD wallet features in order to allow using the mnemonic features
-    Account.enable_unaudited_hdwallet_features()
-
-    # Derive the account from the mnemonic
-    account = Account.from_mnemonic(mnemonic)
-    nonce = web3.eth.get_transaction_count(account.address)
+    # Derive the account from the mnemonic, only on the first invocation of a warm Lambda
+    account = get_derived_from_secret(ACCOUNTS, mnemonic, Account.from_mnemonic)
 
     all_success = True
-    
-    # Iterate over the data and publish each row to Celo
+
+    # Collect the routes not published yet, with the arguments expected by the contract
+    pending_routes = []
     for route in all_routes:
         try:
             route_id = route['routeID']
-            timestamp_start = route['timestampStart']
-            timestamp_end = route['timestampEnd']
-            measured_distance = route['measuredDistance']
-            celo_address = route['celo_address']
 
             # Check if the route has already been published and skip if it has
             if route_id in published_routes:
                 logger.info(f"Route id {route_id} is already published. Skipping re-publishing.")
                 continue
 
-            # Check if the elapsed time has exceeded 90% of the specified timeout duration.
-            # If so, stop publishing routes. This precaution ensures that the system has
-            # enough time to save progress and perform any necessary cleanup operations
-            # before the total timeout period is reached.
-            current_time = time.time()
-            elapsed_time = current_time - start_time
-            if elapsed_time  > timeout * 0.9:
-                logger.error(
-                    f"Approaching timeout limit ({timeout} seconds). Elapsed time: {elapsed_time:.2f} seconds. "
-                    "Stopping route publishing as a precaution."
-                )
+            pending_routes.append((route_id, (route['celo_address'], int(route_id), int(route['timestampStart']),
+                                              int(route['timestampEnd']), int(route['measuredDistance']))))
+        except Exception as e:
+            logger.error(f"    -> Error publishing route id {route.get('routeID')}: {e}")
+            all_success = False
+            break
+
+    # Publish the routes in batches, each one recorded by a single transaction, and the batches in windows
+    window_size = batch_size * ROUTE_PIPELINE_SIZE
+    for window_start in range(0, len(pending_routes), window_size):
+        # Check if the elapsed time has exceeded 90% of the specified timeout duration.
+        # If so, stop publishing routes. This precaution ensures that the system has
+        # enough time to save progress and perform any necessary cleanup operations
+        # before the total timeout period is reached.
+        current_time = time.time()
+        elapsed_time = current_time - start_time
+        if elapsed_time  > timeout * 0.9:
+            logger.error(
+                f"Approaching timeout limit ({timeout} seconds). Elapsed time: {elapsed_time:.2f} seconds. "
+                "Stopping route publishing as a precaution."
+            )
+            all_success = False
+            break
+
+        window = pending_routes[window_start:window_start + window_size]
+        nonce = web3.eth.get_transaction_count(account.address, 'pending')
+        gas_price = web3.eth.gas_price
+        pending_transactions = []
+        stop_publishing = False
+
+        # Phase 1: send every transaction of the window back to back, incrementing the nonce locally
+        for start in range(0, len(window), batch_size):
+            route_batch = window[start:start + batch_size]
+            route_ids = [route_id for route_id, _ in route_batch]
+            try:
+                tx_hash = send_route_transaction(web3, contract, route_batch, use_batch_recording, account, nonce,
+                                                 gas_price)
+            except Exception as e:
+                logger.error(f"    -> Error publishing route ids {route_ids}: {e}")
                 all_success = False
+                stop_publishing = True
                 break
 
-            # Estimate gas for the transaction
-            estimated_gas = contract.functions.recordRoute(
-                                to=celo_address,
-                                routeId=int(route_id),
-                                _timestampStart=int(timestamp_start),
-                                _timestampEnd=int(timestamp_end),
-                                _distance=int(measured_distance)
-                            ).estimate_gas({'from': account.address})
-
-            gas_price = web3.eth.gas_price
-
-            tx = contract.functions.recordRoute(
-                to=celo_address,
-                routeId=int(route_id),
-                _timestampStart=int(timestamp_start),
-                _timestampEnd=int(timestamp_end),
-                _distance=int(measured_distance)
-            ).build_transaction({
-                'from': account.address,
-                'nonce': nonce,
-                'gas': estimated_gas + 100000,  # extra margin for gas
-                'gasPrice': gas_price
-            })
-
-            # Sign the transaction
-            signed_tx = account.sign_transaction(tx)
-            tx_hash = Web3.keccak(signed_tx.rawTransaction)
-            logger.info(f"Publishing route id {route['routeID']}, with: nonce = {nonce}, gas_price = {gas_price}, and tx_hash = {tx_hash.hex()}")
-
-            # Send the transaction
-            tx_hash = web3.eth.send_raw_transaction(signed_tx.rawTransaction)
-            logger.info(f"    -> Sent transaction for route id {route_id}, awaiting receipt...")
-
-            # Wait until transaction is successfully receipt
-            time.sleep(2) # wait 2 seconds before verifying transaction receipt
-            tx_receipt = wait_for_transaction_receipt(web3, tx_hash)
+            logger.info(f"    -> Sent transaction for route ids {route_ids}, awaiting receipt...")
+            pending_transactions.append((route_ids, nonce, tx_hash))
+
+            # Increment the nonce for subsequent transactions
+            nonce += 1
+
+        # Phase 2: wait until the transactions of the window are successfully receipt
+        for route_ids, tx_nonce, tx_hash in pending_transactions:
+            tx_receipt = wait_for_transaction_receipt(web3, tx_hash, initial_poll_interval=poll_interval)
 
             if not tx_receipt:
-                logger.error(f"    -> Failed to get receipt for route id {route_id}. Stopping further transactions.")
+                # Routes of the window mined anyway are found minted by the next run, and not published again
+                logger.error(f"    -> Failed to get receipt for route ids {route_ids}. Stopping further transactions.")
                 all_success = False
+                stop_publishing = True
                 break
 
-            logger.info(f"    -> Transaction successfully sent: route id {route['routeID']}, hash {tx_hash.hex()}")
-            published_routes[route_id] = {
-                "nonce": nonce,
-                "gas_price": gas_price,
-                "tx_hash": tx_hash.hex()
-            }
-
-            # Increment the nonce for subsequent transactions
-            nonce += 1
+            if tx_receipt['status'] == 0:
+                route_id = route_ids[0]
+                if not use_batch_recording and is_route_minted(contract, int(route_id)):
+                    logger.info(f"Token already minted for route id {route_id}. Continuing with next transaction.")
+                    published_routes[route_id] = {
+                        "nonce": "unkown",
+                        "gas_price": "unkown",
+                        "tx_hash": "already minted"
+                    }
+                    continue
+                logger.error(f"    -> Transaction reverted for route ids {route_ids}, hash {tx_hash.hex()}. "
+                             f"Stopping further transactions.")
+                all_success = False
+                stop_publishing = True
+                break
 
-        except Exception as e:
-            error_message = str(e)
-            if "ERC721: token already minted" in error_message:
-                logger.info(f"Token already minted for route id {route_id}. Continuing with next transaction.")
+            for route_id in route_ids:
+                logger.info(f"    -> Transaction successfully sent: route id {route_id}, hash {tx_hash.hex()}")
                 published_routes[route_id] = {
-                    "nonce": "unkown",
-                    "gas_price": "unkown",
-                    "tx_hash": "already minted"
+                    "nonce": tx_nonce,
+                    "gas_price": gas_price,
+                    "tx_hash": tx_hash.hex()
                 }
-                continue
-            else:
-                logger.error(f"    -> Error publishing route id {route_id}: {e}")
-                all_success = False
-                break
+
+        if stop_publishing:
+            break
 
     return all_success, published_routes
 
@@ -311,6 +429,10 @@ def fetch_input_csv_data(input_prefix):
     """
     Fetches and reads CSV data from S3 based on the specified prefix.
 
+    Reading a file is bound by the S3 request latency, so up to CSV_READ_WORKERS files are read at the same time,
+    sharing the S3 client of python_utilities, which is thread-safe and pools its connections. The rows are returned
+    in the same order as if the files were read one after the other.
+
     Parameters:
     - input_prefix (str): The S3 prefix to list and read CSV files from.
 
@@ -318,12 +440,15 @@ def fetch_input_csv_data(input_prefix):
     - list: A list of dictionaries, each representing a row from the CSV files found at the specified prefix.
     """
     csv_file_keys = list_s3_files(input_prefix)
-    csv_data = []
-    for key in csv_file_keys:
+    if not csv_file_keys:
+        return []
+
+    def read_csv_file(key):
         logger.info(f"    -> reading {key}")
-        for row in read_csv_from_s3(os.path.join(RODAAPP_BUCKET_PREFIX, key)):
-            csv_data.append(row)
-    return csv_data
+        return read_csv_from_s3(os.path.join(RODAAPP_BUCKET_PREFIX, key))
+
+    with ThreadPoolExecutor(max_workers=min(CSV_READ_WORKERS, len(csv_file_keys))) as executor:
+        return list(chain.from_iterable(executor.map(read_csv_file, csv_file_keys)))
 
 
 def handler(event: Dict[str, Any], context: Any) -> None:
@@ -340,7 +465,8 @@ def handler(event: Dict[str, Any], context: Any) -> None:
     - event (Dict[str, Any]): A dictionary containing the execution parameters. Key parameters include
       'environment' for specifying the execution context (staging or production, optional, defaults to staging), 'processing_date' for the
       target date of the data to process (optional, defaults to yesterday date), and 'timeout' for the maximum allowed execution time in seconds
-      (optional, defaults to 900 seconds if not provided).
+      (optional, defaults to 900 seconds if not provided), and 'poll_interval' for the time in seconds before the
+      second receipt poll of each transaction (optional, defaults to RECEIPT_POLL_INTERVAL).
     - context (Any): Context information provided by AWS Lambda. This parameter is not used within the function
       but is required for AWS Lambda compatibility.
 
@@ -360,6 +486,7 @@ def handler(event: Dict[str, Any], context: Any) -> None:
     processing_date = validate_date(processing_date) if processing_date else yesterday()
     environment = event.get("environment", "staging")
     timeout = int(event.get("timeout", 900))
+    poll_interval = float(event.get("poll_interval", RECEIPT_POLL_INTERVAL))
     input_prefix = os.path.join(RODAAPP_BUCKET_PREFIX, f"rappi_driver_routes/date={format_dashed_date(processing_date)}/")
     celo_published_path = os.path.join(RODAAPP_BUCKET_PREFIX, environment, "celo_published_routes",
                                            f"date={format_dashed_date(processing_date)}", "already_published_routes.json")
@@ -374,7 +501,8 @@ def handler(event: Dict[str, Any], context: Any) -> None:
     all_routes = fetch_input_csv_data(input_prefix)
     published_routes = fetch_published_routes(celo_published_path)
 
-    all_success, published_routes = publish_to_celo(web3, roda_route_contract_addr, roda_route_contract_abi, all_routes, published_routes, mnemonic, timeout)
+    all_success, published_routes = publish_to_celo(web3, roda_route_contract_addr, roda_route_contract_abi, all_routes, published_routes, mnemonic, timeout,
+                                                    poll_interval)
     logger.info(f"uploading to s3 routes that already were published: {celo_published_path}")
     dict_to_json_s3(published_routes, celo_published_path)
 
@@ -410,11 +538,16 @@ if __name__ == "__main__":
             default=900,
             required=False
         )
+        parser.add_argument("-p", "--poll-interval", type=float, default=RECEIPT_POLL_INTERVAL, required=False,
+                            help="Time (in seconds) before the second receipt poll of each transaction, later polls "
+                                 f"back off up to the block time. Default is {RECEIPT_POLL_INTERVAL} seconds.")
 
         args = parser.parse_args()
         setup_local_logger() # when it does not have env vars from aws, it means that this script is running locally 
         if args.date:
             handler(dict(processing_date=format_dashed_date(args.date),
-                            environment=args.environment, timeout=args.timeout), "dockerlocal")
+                            environment=args.environment, timeout=args.timeout, poll_interval=args.poll_interval),
+                    "dockerlocal")
         else:
-            handler(dict(environment=args.environment, timeout=args.timeout), "dockerlocal")
\ No newline at end of file
+            handler(dict(environment=args.environment, timeout=args.timeout, poll_interval=args.poll_interval),
+                    "dockerlocal")
\ No newline at end of file
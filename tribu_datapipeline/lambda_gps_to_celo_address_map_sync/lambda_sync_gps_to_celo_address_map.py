@@ -40,30 +40,66 @@ from airtable import Airtable
 from bip_utils import Bip39SeedGenerator, Bip44, Bip44Coins, Bip44Changes
 from typing import Dict, Any
 from python_utilities.utils import read_yaml_from_s3, logger, dict_to_yaml_s3, \
-    				setup_local_logger, RODAAPP_BUCKET_PREFIX
+    				setup_local_logger, get_derived_from_secret, RODAAPP_BUCKET_PREFIX
 
 
-def generate_celo_address(celo_credentials, index=0):
+# BIP44 external chain contexts derived from each mnemonic, kept across warm Lambda invocations, keyed by the
+# mnemonic's SHA-256 digest
+BIP44_CHAIN_CONTEXTS: Dict[bytes, Bip44] = {}
+
+
+def get_bip44_chain_context(mnemonic: str) -> Bip44:
     """
-    Generates a Celo address from a mnemonic and an index.
+    Returns the BIP44 context of the external chain derived from the mnemonic, deriving it only the first time.
+
+    Deriving the seed runs PBKDF2 over the mnemonic and deriving the account path chains several HMAC-SHA512
+    operations, while deriving one more address index from the external chain context is a single step. The
+    context is kept at module level, so it is also reused across warm AWS Lambda invocations. It is keyed by a hash
+    of the mnemonic, not by the mnemonic itself.
 
     Args:
-    celo_credentials (dict): Dictionary containing the mnemonic.
-    index (int): Index to alter the derivation path for different addresses.
+    mnemonic (str): The mnemonic phrase the addresses are derived from.
 
     Returns:
-    str: A Celo blockchain address.
+    Bip44: The BIP44 context of the external chain of the first account, for the Ethereum coin type used by Celo.
+    """
+    return get_derived_from_secret(BIP44_CHAIN_CONTEXTS, mnemonic, derive_bip44_chain_context)
+
+
+def derive_bip44_chain_context(mnemonic: str) -> Bip44:
+    """
+    Derives the BIP44 context of the external chain from the mnemonic.
+
+    Args:
+    mnemonic (str): The mnemonic phrase the addresses are derived from.
+
+    Returns:
+    Bip44: The BIP44 context of the external chain of the first account, for the Ethereum coin type used by Celo.
     """
     # Generate seed from mnemonic
-    seed = Bip39SeedGenerator(celo_credentials["MNEMONIC"]).Generate()
+    seed = Bip39SeedGenerator(mnemonic).Generate()
 
     # Generate the Bip44 wallet for the Celo coin
     bip44_mst_ctx = Bip44.FromSeed(seed, Bip44Coins.ETHEREUM)
 
-    # Derive the address at the specified index
+    # Derive the external chain of the first account, addresses are derived from it by index
     bip44_acc_ctx = bip44_mst_ctx.Purpose().Coin().Account(0)
-    bip44_chg_ctx = bip44_acc_ctx.Change(Bip44Changes.CHAIN_EXT)
-    bip44_addr_ctx = bip44_chg_ctx.AddressIndex(index)
+    return bip44_acc_ctx.Change(Bip44Changes.CHAIN_EXT)
+
+
+def generate_celo_address(celo_credentials, index=0):
+    """
+    Generates a Celo address from a mnemonic and an index.
+
+    Args:
+    celo_credentials (dict): Dictionary containing the mnemonic.
+    index (int): Index to alter the derivation path for different addresses.
+
+    Returns:
+    str: A Celo blockchain address.
+    """
+    # Derive the address at the specified index
+    bip44_addr_ctx = get_bip44_chain_context(celo_credentials["MNEMONIC"]).AddressIndex(index)
 
     return bip44_addr_ctx.PublicKey().ToAddress()
 
@@ -70,6 +70,7 @@ MAXIMUM_DISTANCE = 9000000 # Meters = 9000km
 MINIMUM_DISTANCE = 0
 MAXIMUM_DURATION = 90 # Minutes
 MINIMUM_DURATION = 2
+NANOSECONDS_PER_MINUTE = 60 * 10**9
 COLUMN_RENAME_MAP = {
     "k_dispositivo": "gpsID",
     "o_fecha_inicial": "timestampStart",
@@ -123,6 +124,21 @@ def upload_pandas_to_s3(s3_path: str, df: pd.DataFrame) -> None:
         upload_buffer_to_s3(s3_path, csv_buffer)
         
 
+def format_minute_timestamps(timestamps: pd.Series) -> pd.Series:
+    """
+    Formats datetime values as strings in OUTPUT_DATETIME_FORMAT ('%Y-%m-%d %H:%M').
+
+    NumPy renders datetime64 values truncated to minutes as 'YYYY-MM-DDTHH:MM' in compiled code, so only the 'T'
+    separator has to be replaced, on the fixed-width character buffer, instead of calling strftime for every value.
+
+    :param timestamps: A Series of timezone-naive datetime values.
+    :return: A Series with the formatted values, NaN where the timestamp is missing, as dt.strftime returns.
+    """
+    formatted = np.datetime_as_string(timestamps.to_numpy(dtype='datetime64[m]'), unit='m').astype('<U16')
+    formatted.view('<U1').reshape(-1, 16)[:, 10] = ' '
+    return pd.Series(formatted, index=timestamps.index, dtype=object).where(timestamps.notna())
+
+
 def format_output_df(df: pd.DataFrame, column_rename_map: Dict[str, str] = COLUMN_RENAME_MAP, 
                      output_datetime_format: str = OUTPUT_DATETIME_FORMAT) -> pd.DataFrame:
     """
@@ -143,6 +159,8 @@ def format_output_df(df: pd.DataFrame, column_rename_map: Dict[str, str] = COLUM
     def convert_datetime(df, datetime_column, output_datetime_format):
         if  output_datetime_format == 'unix':
             return pd.to_datetime(df[datetime_column]).astype('int64') // 10**9
+        elif output_datetime_format == OUTPUT_DATETIME_FORMAT:
+            return format_minute_timestamps(pd.to_datetime(df[datetime_column]))
         else:
             return pd.to_datetime(df[datetime_column]).dt.strftime(output_datetime_format)
 
@@ -173,10 +191,12 @@ def filter_by_distance_range(df: pd.DataFrame, min_dist: float = MINIMUM_DISTANC
     :param max_dist: Maximum distance for filtering. Defaults to None.
     :return: A DataFrame filtered by the specified distance range.
     """
-    df = df[df['f_distancia'] > float(min_dist)]
+    # Both bounds are combined into a single mask over the raw values, so the DataFrame is only copied once
+    distances = df['f_distancia'].to_numpy()
+    mask = distances > float(min_dist)
     if max_dist:
-        df = df[df['f_distancia'] <= float(max_dist)]
-    return df
+        mask &= distances <= float(max_dist)
+    return df[mask]
 
 
 def filter_by_duration_range(df: pd.DataFrame, min_dur: float = MINIMUM_DURATION, 
@@ -205,11 +225,13 @@ def filter_by_duration_range(df: pd.DataFrame, min_dur: float = MINIMUM_DURATION
       The 'durationMinutes' column is added to the DataFrame to show the 
       calculated duration for each row.
     """
-    df['durationMinutes'] = (df['o_fecha_final'] - df['o_fecha_inicial']).dt.total_seconds() / 60
-    df = df[df['durationMinutes'] > float(min_dur)]
+    # Durations are compared as int64 nanoseconds in a single mask, without going through a timedelta Series
+    durations = (df['o_fecha_final'].to_numpy() - df['o_fecha_inicial'].to_numpy()).astype('timedelta64[ns]').view('int64')
+    df['durationMinutes'] = durations / NANOSECONDS_PER_MINUTE
+    mask = durations > float(min_dur) * NANOSECONDS_PER_MINUTE
     if max_dur:
-        df = df[df['durationMinutes'] <= float(max_dur)]
-    return df
+        mask &= durations <= float(max_dur) * NANOSECONDS_PER_MINUTE
+    return df[mask]
 
 
 def fix_distance_by_max_per_hour(df: pd.DataFrame, max_distance_per_hour: float) -> pd.DataFrame:
@@ -677,14 +699,15 @@ def handler(event: Dict[str, Any], context: Any) -> None:
 
     logger.info("Applying filters")
 
-    # format datetime on input data in order to make it easier to do datetime operations
-    format_datetime_column(df, "o_fecha_inicial", input_datetime_format)
-    format_datetime_column(df, "o_fecha_final", input_datetime_format)
-
+    # The distance filter does not need the timestamps, so it goes first and they are only parsed for the routes it keeps
     if "distance_filter" in trans_params:
         distance_filter = trans_params["distance_filter"]
         df = filter_by_distance_range(df, distance_filter["min"], distance_filter.get("max"))
 
+    # format datetime on input data in order to make it easier to do datetime operations
+    format_datetime_column(df, "o_fecha_inicial", input_datetime_format)
+    format_datetime_column(df, "o_fecha_final", input_datetime_format)
+
     if "duration_filter" in trans_params:
         duration_filter = trans_params["duration_filter"]
         df = filter_by_duration_range(df, duration_filter["min"], duration_filter.get("max"))
@@ -704,7 +727,6 @@ def handler(event: Dict[str, Any], context: Any) -> None:
     df = add_celo_contract_address(df)
 
     if "guajira_celo_address" in trans_params:
-        print("entró en guajira protos")
         guajira_celo_address = trans_params["guajira_celo_address"]
         df = assign_guajira_protos_routes(df, guajira_celo_address["address"])
 
@@ -8,7 +8,7 @@ fields, adjusts GPS coordinates to standard precision, and exports the processed
 with renamed columns according to a predefined mapping.
 
 Key Features:
-- Read data from a CSV file.
+- Read data from a CSV file in chunks, so memory use does not grow with the size of the input.
 - Filter records based on distance, duration range, and client reference availability.
 - Format datetime fields to a specific format.
 - Adjust GPS coordinates to standard format and create location pairs.
@@ -44,6 +44,7 @@ MAXIMUM_DISTANCE = 9000000 # Meters = 9000km
 MINIMUM_DISTANCE = 0
 MAXIMUM_DURATION = 90 # Minutes
 MINIMUM_DURATION = 2
+NANOSECONDS_PER_MINUTE = 60 * 10**9
 COLUMN_RENAME_MAP = {
     "Dispositivo": "gpsID",
     "Fecha Inicio": "timestampStart",
@@ -53,22 +54,45 @@ COLUMN_RENAME_MAP = {
     "endLocation": "endLocation",
     "durationMinutes": "durationMinutes",
 }
+OUTPUT_COLUMNS = list(COLUMN_RENAME_MAP.keys())
+OUTPUT_COLUMN_NAMES = list(COLUMN_RENAME_MAP.values())
 INPUT_DATETIME_FORMAT = "%m/%d/%y %H:%M"
 OUTPUT_DATETIME_FORMAT = "%Y-%m-%d %H:%M"
 PRECISION_DIGITS_FOR_GPS_LOCATION = 8
+GPS_COORDINATE_SCALE = 10.0 ** PRECISION_DIGITS_FOR_GPS_LOCATION # Divisor turning the integer coordinates into degrees
+CSV_CHUNK_SIZE = 200000 # Rows read, processed and written at a time
+GPS_COORDINATE_COLUMNS = ['Lng. Inicial', 'Lat. Inicial', 'Lng. Final', 'Lat. Final']
+INPUT_COLUMNS = ["Dispositivo", "Referencia", "Fecha Inicio", "Fecha Fin", "Distancia"] + GPS_COORDINATE_COLUMNS
+# Distancia is written to the output as is, so its type is still inferred: whole distances stay integers
+INPUT_COLUMN_DTYPES = {
+    "Dispositivo": "category", # Few devices repeated over many rows, stored as integer codes into their names
+    "Referencia": "object",
+    "Fecha Inicio": "object",
+    "Fecha Fin": "object",
+    "Lng. Inicial": "float64",
+    "Lat. Inicial": "float64",
+    "Lng. Final": "float64",
+    "Lat. Final": "float64",
+}
 
 
-def get_data_from_csv(path):
+def get_data_from_csv(path, chunksize=None):
     """
     Read data from a CSV file into a pandas DataFrame.
 
+    Only the INPUT_COLUMNS used by the processing are parsed, with the types of INPUT_COLUMN_DTYPES given up front
+    instead of inferred.
+
     Parameters:
     path (str): The file path of the CSV file to be read.
+    chunksize (int, optional): Number of rows per chunk. If given, the file is read lazily in chunks instead of
+                               at once. Defaults to None.
 
     Returns:
-    pandas.DataFrame: A DataFrame containing the data from the CSV file.
+    pandas.DataFrame: A DataFrame containing the INPUT_COLUMNS columns from the CSV file, or an iterator of
+                      such DataFrames, one per chunk, if chunksize is given.
     """
-    return pd.read_csv(path)
+    return pd.read_csv(path, usecols=INPUT_COLUMNS, dtype=INPUT_COLUMN_DTYPES, chunksize=chunksize)
 
 
 def filter_by_distance_range(df, min_dist=MINIMUM_DISTANCE, max_dist=MAXIMUM_DISTANCE):
@@ -84,7 +108,7 @@ def filter_by_distance_range(df, min_dist=MINIMUM_DISTANCE, max_dist=MAXIMUM_DIS
     pandas.DataFrame: A filtered DataFrame where the 'Distancia' column values 
                       fall within the specified distance range.
     """
-    return df[(df['Distancia'] > min_dist) & (df['Distancia'] <= max_dist)]
+    return df[df['Distancia'].between(min_dist, max_dist, inclusive='right')]
 
 
 def filter_by_duration_range(df, min_dur=MINIMUM_DURATION, max_dur=MAXIMUM_DURATION):
@@ -111,8 +135,10 @@ def filter_by_duration_range(df, min_dur=MINIMUM_DURATION, max_dur=MAXIMUM_DURAT
       The 'durationMinutes' column is added to the DataFrame to show the 
       calculated duration for each row.
     """
-    df['durationMinutes'] = (df['Fecha Fin'] - df['Fecha Inicio']).dt.total_seconds() / 60
-    return df[(df['durationMinutes'] > min_dur) & (df['durationMinutes'] <= max_dur)]
+    # Durations are compared as int64 nanoseconds, without going through a timedelta Series and total_seconds
+    durations = (df['Fecha Fin'].to_numpy() - df['Fecha Inicio'].to_numpy()).astype('timedelta64[ns]').view('int64')
+    df['durationMinutes'] = durations / NANOSECONDS_PER_MINUTE
+    return df[(durations > min_dur * NANOSECONDS_PER_MINUTE) & (durations <= max_dur * NANOSECONDS_PER_MINUTE)]
 
 
 def filter_by_missing_client_reference(df):
@@ -154,31 +180,29 @@ def format_datetime_column(df, dt_column):
     df[dt_column] = pd.to_datetime(df[dt_column], format=INPUT_DATETIME_FORMAT)
 
 
-def write_to_local_csv(df, output_path):
+def write_to_local_csv(df, output_path, append=False):
     """
     Write a DataFrame to a CSV file after renaming its columns.
 
     This function renames the columns of the input DataFrame according to the 
     COLUMN_RENAME_MAP dictionary and writes the resulting DataFrame to a CSV file at 
     the specified output path. The order of the columns in the output CSV will follow 
-    the order they are defined in COLUMN_RENAME_MAP.
+    the order they are defined in COLUMN_RENAME_MAP. The columns are selected and renamed
+    by the CSV writer itself, so the DataFrame is neither copied nor modified.
 
     Parameters:
     df (pandas.DataFrame): The DataFrame to be processed.
     output_path (str): The file path where the CSV file will be saved.
+    append (bool, optional): Whether to append the rows, without header, to an existing file instead of
+                             overwriting it. Defaults to False.
 
     Returns:
     None
     """
-    # Rename columns and reorder according to COLUMN_RENAME_MAP
-    df = df[list(COLUMN_RENAME_MAP.keys())].rename(columns=COLUMN_RENAME_MAP)
-
-    # Fix the output format for timestamp columns according to OUTPUT_DATETIME_FORMAT
-    df['timestampStart'] = df['timestampStart'].dt.strftime(OUTPUT_DATETIME_FORMAT)
-    df['timestampEnd'] = df['timestampEnd'].dt.strftime(OUTPUT_DATETIME_FORMAT)
-    
-    # Write to CSV without index
-    df.to_csv(output_path, index=False)
+    # Write to CSV without index, with the columns reordered and renamed according to COLUMN_RENAME_MAP and the
+    # timestamps in OUTPUT_DATETIME_FORMAT. The header only goes with the first rows of the file
+    df.to_csv(output_path, columns=OUTPUT_COLUMNS, header=False if append else OUTPUT_COLUMN_NAMES, index=False,
+              mode='a' if append else 'w', date_format=OUTPUT_DATETIME_FORMAT)
 
 
 def fix_gps_coordinates(df):
@@ -186,7 +210,7 @@ def fix_gps_coordinates(df):
     Adjusts GPS coordinates in the DataFrame for standard geospatial precision and creates new columns for start and end locations.
 
     This function corrects the longitude and latitude columns ('Lng. Inicial', 'Lat. Inicial', 
-    'Lng. Final', 'Lat. Final') by dividing their values by 10 raised to the power of 
+    'Lng. Final', 'Lat. Final') by dividing their values by GPS_COORDINATE_SCALE, 10 raised to the power of 
     PRECISION_DIGITS_FOR_GPS_LOCATION. This adjustment is necessary to introduce decimal points 
     into the coordinates, converting them into a standard GPS coordinate format. Subsequently, 
     it creates two new columns ('startLocation' and 'endLocation'), each containing a tuple 
@@ -204,23 +228,29 @@ def fix_gps_coordinates(df):
     The constant PRECISION_DIGITS_FOR_GPS_LOCATION is used to define the level of decimal 
     precision for the GPS coordinates.
     """
-    df['Lng. Inicial'] = df['Lng. Inicial'] / 10**PRECISION_DIGITS_FOR_GPS_LOCATION
-    df['Lat. Inicial'] = df['Lat. Inicial'] / 10**PRECISION_DIGITS_FOR_GPS_LOCATION
-    df['Lng. Final'] = df['Lng. Final'] / 10**PRECISION_DIGITS_FOR_GPS_LOCATION
-    df['Lat. Final'] = df['Lat. Final'] / 10**PRECISION_DIGITS_FOR_GPS_LOCATION
-    df['startLocation'] = df.apply(lambda row: (row['Lng. Inicial'], row['Lat. Inicial']), axis=1)
-    df['endLocation'] = df.apply(lambda row: (row['Lng. Final'], row['Lat. Final']), axis=1)
+    # The four coordinate columns are scaled in place, in a single operation over their values as one 2D array
+    coordinates = df[GPS_COORDINATE_COLUMNS].to_numpy(dtype='float64', copy=True)
+    coordinates /= GPS_COORDINATE_SCALE
+    df[GPS_COORDINATE_COLUMNS] = coordinates
+
+    # Location pairs are zipped from the scaled block instead of building them row by row with apply. Its columns are
+    # converted to Python floats in a single pass each, so no NumPy scalar is boxed per value and every pair is written
+    # as "(lng, lat)" whatever the NumPy version
+    longitudes_start, latitudes_start, longitudes_end, latitudes_end = coordinates.T.tolist()
+    df['startLocation'] = list(zip(longitudes_start, latitudes_start))
+    df['endLocation'] = list(zip(longitudes_end, latitudes_end))
 
 
 def main(args):
-    df = get_data_from_csv(args.input)
-    df = filter_by_distance_range(df)
-    df = filter_by_missing_client_reference(df)
-    format_datetime_column(df, "Fecha Inicio")
-    format_datetime_column(df, "Fecha Fin")
-    df = filter_by_duration_range(df)
-    fix_gps_coordinates(df)
-    write_to_local_csv(df, args.output)
+    # Every step works row by row, so each chunk is processed and written on its own and only one is held in memory
+    for chunk_number, df in enumerate(get_data_from_csv(args.input, chunksize=CSV_CHUNK_SIZE)):
+        df = filter_by_distance_range(df)
+        df = filter_by_missing_client_reference(df)
+        format_datetime_column(df, "Fecha Inicio")
+        format_datetime_column(df, "Fecha Fin")
+        df = filter_by_duration_range(df)
+        fix_gps_coordinates(df)
+        write_to_local_csv(df, args.output, append=chunk_number > 0)
 
 
 if __name__ == "__main__":